@@ -34,6 +34,8 @@ class AnnotationSpec(Code["AnnotationSpec"]):
     Java annotations for classes, methods, fields, parameters, etc.
     """
 
+    __slots__ = ("type_name", "members")
+
     type_name: "TypeName"
     members: dict[str, list[CodeBlock]]
 
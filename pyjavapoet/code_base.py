@@ -20,6 +20,8 @@ from pyjavapoet.code_writer import CodeWriter
 
 
 class Code[C: "Code"](ABC):
+    __slots__ = ()
+
     @abstractmethod
     def emit(self, code_writer: "CodeWriter") -> None: ...
 
@@ -44,10 +46,15 @@ class Code[C: "Code"](ABC):
         return hash(str(self))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            # Nothing to render when a spec is compared with itself
+            return True
         if not isinstance(other, Code):
             return False
         return str(self) == str(other)
 
     class Builder[T: "Code"](ABC):
+        __slots__ = ()
+
         @abstractmethod
         def build(self) -> T: ...
@@ -18,12 +18,15 @@ Modified by Matthew Au-Yeung on 2025-07-29; see changelog.md for more details.
 """
 
 import re
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 from pyjavapoet.code_base import Code
 from pyjavapoet.code_writer import CodeWriter
 from pyjavapoet.type_name import TypeName
-from pyjavapoet.util import deep_copy
+from pyjavapoet.util import deep_copy, string_literal
 
 
 class CodeBlock(Code["CodeBlock"]):
@@ -35,9 +38,11 @@ class CodeBlock(Code["CodeBlock"]):
     placeholders like $L (literals), $S (strings), $T (types), and $N (names).
     """
 
-    format_parts: list[str]
-    args: list[Any]
-    named_args: dict[str, Any]
+    __slots__ = ("format_parts", "args", "named_args", "__hash", "__rendered", "__instructions")
+
+    format_parts: Sequence[str]
+    args: Sequence[Any]
+    named_args: Mapping[str, Any]
 
     # Matches:
     #   $L, $S, $T, $N, $<, $>
@@ -79,45 +84,58 @@ class CodeBlock(Code["CodeBlock"]):
         re.VERBOSE,
     )
 
-    def __init__(self, format_parts: list[str], args: list[Any], named_args: dict[str, Any]):
+    def __init__(self, format_parts: Sequence[str], args: Sequence[Any], named_args: Mapping[str, Any]):
         self.format_parts = format_parts
         self.args = args
         self.named_args = named_args
+        # Rendering and hashing are computed on first use and kept since CodeBlock is immutable
+        self.__rendered: str | None = None
+        self.__hash: int | None = None
+        # Each format part paired with its parsed placeholder (or None), built on first emit
+        self.__instructions: tuple[tuple[str, tuple | None], ...] | None = None
+
+    def __str__(self) -> str:
+        if self.__rendered is None:
+            self.__rendered = super().__str__()
+        return self.__rendered
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(str(self))
+        return self.__hash
+
+    def is_empty(self) -> bool:
+        return not any(self.format_parts)
 
     def emit(self, code_writer: "CodeWriter", new_line_prefix: str = "") -> None:
         arg_index = 0
 
-        for part in self.format_parts:
-            # Look for placeholders like $L, $S, $T, $N
-            placeholder_match = re.search(CodeBlock.placeholder_match, part)
-            if placeholder_match:
-                # Emit everything before the placeholder
-                if placeholder_match.start() > 0:
-                    code_writer.emit(part[: placeholder_match.start()], new_line_prefix)
-
-                # Get the placeholder type
-                placeholder_type = (
-                    placeholder_match.group("type1")
-                    or placeholder_match.group("type2")
-                    or placeholder_match.group("type3")
-                )
-                placeholder_index = placeholder_match.group("index")
-                placeholder_name = placeholder_match.group("name")
+        instructions = self.__instructions
+        if instructions is None:
+            # Look for placeholders like $L, $S, $T, $N. Builder.add splits every placeholder
+            # into its own part, so only parts starting with "$" need to be matched.
+            instructions = self.__instructions = tuple(
+                (part, _parse_placeholder(part) if part.startswith("$") else None) for part in self.format_parts
+            )
+
+        for part, placeholder in instructions:
+            if placeholder:
+                placeholder_type, placeholder_index, placeholder_name, placeholder_end = placeholder
 
                 # Handle the placeholder
-                if placeholder_type == ">":  # Indent
-                    count = int(placeholder_index) if placeholder_index else 1
-                    code_writer.indent(count)
-                elif placeholder_type == "<":  # Unindent
-                    count = int(placeholder_index) if placeholder_index else 1
-                    code_writer.unindent(count)
-                elif arg_index < len(self.args) or placeholder_name or placeholder_index:
+                if placeholder_type in _INDENT_PLACEHOLDERS:
+                    count = placeholder_index if placeholder_index is not None else 1
+                    if placeholder_type == ">":
+                        code_writer.indent(count)
+                    else:
+                        code_writer.unindent(count)
+                elif arg_index < len(self.args) or placeholder_name or placeholder_index is not None:
                     if placeholder_name:
-                        if placeholder_name not in self.named_args:
+                        arg = self.named_args.get(placeholder_name, _MISSING)
+                        if arg is _MISSING:
                             raise KeyError(f"No argument found for placeholder {placeholder_name}")
-                        arg = self.named_args[placeholder_name]
-                    elif placeholder_index:
-                        index = int(placeholder_index) - 1
+                    elif placeholder_index is not None:
+                        index = placeholder_index - 1
                         if index >= len(self.args):
                             raise IndexError(f"No argument found for placeholder {placeholder_index}")
                         arg = self.args[index]
@@ -133,10 +151,8 @@ class CodeBlock(Code["CodeBlock"]):
                         else:
                             code_writer.emit(str(arg), new_line_prefix)
                     elif placeholder_type == "S":  # String
-                        # Escape special characters
-                        escaped = str(arg).replace("\\", "\\\\").replace('"', '\\"')
-                        # Add quotes
-                        code_writer.emit(f'"{escaped}"', new_line_prefix)
+                        # Quote and escape as a Java string literal
+                        code_writer.emit(string_literal(str(arg)), new_line_prefix)
                     elif placeholder_type == "T":  # Type
                         # Let the CodeWriter handle type imports
                         arg = TypeName.get(arg)
@@ -148,8 +164,8 @@ class CodeBlock(Code["CodeBlock"]):
                             code_writer.emit(str(arg), new_line_prefix)
 
                 # Emit everything after the placeholder
-                if placeholder_match.end() < len(part):
-                    code_writer.emit(part[placeholder_match.end() :], new_line_prefix)
+                if placeholder_end < len(part):
+                    code_writer.emit(part[placeholder_end:], new_line_prefix)
             else:
                 # No placeholders, emit the whole part
                 code_writer.emit(part, new_line_prefix)
@@ -166,10 +182,13 @@ class CodeBlock(Code["CodeBlock"]):
         return str(writer)
 
     def to_builder(self) -> "Builder":
-        return CodeBlock.Builder(deep_copy(self.format_parts), deep_copy(self.args), deep_copy(self.named_args))
+        # Shared blocks from CodeBlock.of hold tuples and a read-only mapping, so copy into a list and dict
+        return CodeBlock.Builder(list(self.format_parts), deep_copy(list(self.args)), deep_copy(dict(self.named_args)))
 
     @staticmethod
     def of(format_string: str, *args, **kwargs) -> "CodeBlock":
+        if not kwargs and len(format_string) <= _INTERN_MAX_LENGTH and all(map(_is_internable_arg, args)):
+            return _interned_of(format_string, *args)
         return CodeBlock.builder().add(format_string, *args, **kwargs).build()
 
     @staticmethod
@@ -178,19 +197,18 @@ class CodeBlock(Code["CodeBlock"]):
 
     @staticmethod
     def join_to_code(code_blocks: list["CodeBlock"], separator: str = "") -> "CodeBlock":
-        builder = CodeBlock.builder()
         if not code_blocks:
-            return builder.build()
-
-        first = True
-        for code_block in code_blocks:
-            if not first:
-                builder.add(separator)
-            first = False
+            return CodeBlock.builder().build()
 
-            builder.add("$L", code_block)
+        # CodeBlocks are immutable, so the joined block references them directly instead of
+        # deep copying each one through a builder
+        separator_parts, _ = _parse_format(separator)
+        format_parts = ["$L"]
+        for _ in code_blocks[1:]:
+            format_parts.extend(separator_parts)
+            format_parts.append("$L")
 
-        return builder.build()
+        return CodeBlock(format_parts, list(code_blocks), {})
 
     @staticmethod
     def add_javadoc(javadoc: Optional["CodeBlock"], format_string: str, *args) -> "CodeBlock":
@@ -227,32 +245,22 @@ class CodeBlock(Code["CodeBlock"]):
             self.format_parts = format_parts or []
             self.args = args or []
             self.named_args = named_args or {}
+            # Flipped by the first non-empty add() so is_empty() never has to scan or render
+            self.__has_content = any(self.format_parts)
+
+        def is_empty(self) -> bool:
+            return not self.__has_content
 
         def add(self, format_string: str, *args, **kwargs) -> "CodeBlock.Builder":
-            # Check for arguments in the format string
-            matches = list(re.finditer(CodeBlock.placeholder_match_with_newlines, format_string))
+            parts, has_placeholders = _parse_format(format_string)
+            self.format_parts.extend(parts)
+            if format_string:
+                self.__has_content = True
 
             # Simple case: no arguments
-            if not matches:
-                self.format_parts.append(format_string)
+            if not has_placeholders:
                 return self
 
-            # Complex case: handle placeholders
-            last_end = 0
-            for match in matches:
-                # Add the part before the placeholder
-                if match.start() > last_end:
-                    self.format_parts.append(format_string[last_end : match.start()])
-
-                # Add the placeholder
-                self.format_parts.append(format_string[match.start() : match.end()])
-
-                last_end = match.end()
-
-            # Add the part after the last placeholder
-            if last_end < len(format_string):
-                self.format_parts.append(format_string[last_end:])
-
             # Add the arguments
             self.args.extend(args)
 
@@ -316,8 +324,100 @@ class CodeBlock(Code["CodeBlock"]):
             self.add("$<}\n")
             return self
 
+        def copy(self) -> "CodeBlock.Builder":
+            """Return an independent builder with the same state, including any open statement."""
+            builder = CodeBlock.Builder(list(self.format_parts), list(self.args), dict(self.named_args))
+            builder.__has_content = self.__has_content
+            builder.__statement_builder_lines = self.__statement_builder_lines
+            return builder
+
         def build(self) -> "CodeBlock":
             if self.__statement_builder_lines != 0:
                 raise ValueError("Started a statement but never ended")
 
             return CodeBlock(deep_copy(self.format_parts), deep_copy(self.args), deep_copy(self.named_args))
+
+
+# Sentinel for named arguments that were never supplied (None is a valid argument)
+_MISSING = object()
+
+# Placeholders that change the indentation instead of consuming an argument
+_INDENT_PLACEHOLDERS = frozenset({">", "<"})
+
+
+@lru_cache(maxsize=1024)
+def _parse_placeholder(part: str) -> tuple[str, int | None, str | None, int] | None:
+    """
+    Parse a placeholder part into (type, index, name, end), or None if the part is not a placeholder.
+    """
+    placeholder_match = CodeBlock.placeholder_match.match(part)
+    if not placeholder_match:
+        return None
+
+    placeholder_type = (
+        placeholder_match.group("type1") or placeholder_match.group("type2") or placeholder_match.group("type3")
+    )
+    placeholder_index = placeholder_match.group("index")
+    return (
+        placeholder_type,
+        int(placeholder_index) if placeholder_index else None,
+        placeholder_match.group("name"),
+        placeholder_match.end(),
+    )
+
+
+# Argument types whose value fully determines how they are emitted, so blocks built from
+# them can be shared. float is left out since 0.0 == -0.0 but they emit differently.
+_INTERNABLE_ARG_TYPES = frozenset({str, int, bool})
+
+# Longer format strings and str args are built fresh, so the cache never keeps large text alive
+_INTERN_MAX_LENGTH = 256
+
+_NO_NAMED_ARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _is_internable_arg(arg: Any) -> bool:
+    arg_type = type(arg)
+    return arg_type in _INTERNABLE_ARG_TYPES and (arg_type is not str or len(arg) <= _INTERN_MAX_LENGTH)
+
+
+# typed=True keeps True and 1 (and EMPTY_STRING and "") in separate entries
+@lru_cache(maxsize=4096, typed=True)
+def _interned_of(format_string: str, *args) -> CodeBlock:
+    # Every caller gets this same block, so its containers are immutable (the parts tuple
+    # comes straight from _parse_format). Like Builder.add, args are dropped without placeholders.
+    format_parts, has_placeholders = _parse_format(format_string)
+    return CodeBlock(format_parts, args if has_placeholders else (), _NO_NAMED_ARGS)
+
+
+# typed=True keeps EMPTY_STRING (a str subclass) from sharing a cache entry with ""
+@lru_cache(maxsize=1024, typed=True)
+def _parse_format(format_string: str) -> tuple[tuple[str, ...], bool]:
+    """
+    Split a format string into literal text, placeholder and newline parts. Format strings
+    repeat a lot (e.g. "$T", "$S", ";\n"), so the result is cached.
+    """
+    matches = list(CodeBlock.placeholder_match_with_newlines.finditer(format_string))
+
+    # Simple case: no arguments
+    if not matches:
+        return (format_string,), False
+
+    # Complex case: handle placeholders
+    parts = []
+    last_end = 0
+    for match in matches:
+        # Add the part before the placeholder
+        if match.start() > last_end:
+            parts.append(format_string[last_end : match.start()])
+
+        # Add the placeholder
+        parts.append(format_string[match.start() : match.end()])
+
+        last_end = match.end()
+
+    # Add the part after the last placeholder
+    if last_end < len(format_string):
+        parts.append(format_string[last_end:])
+
+    return tuple(parts), True
@@ -35,8 +35,22 @@ class CodeWriter:
     Handles emitting Java code with proper formatting.
     """
 
+    __slots__ = (
+        "__indent",
+        "__indent_cache",
+        "__out",
+        "__indent_level",
+        "__line_start",
+        "__imports",
+        "__excluded_scoped_classes",
+        "__package_name",
+    )
+
     __indent: str
+    # Indent prefix for each level, extended lazily as deeper levels are used
+    __indent_cache: list[str]
     # TODO: __max_line_length: int
+    # Output chunks, joined once when the text is read
     __out: list[str]
     __indent_level: int
     __line_start: bool
@@ -54,6 +68,7 @@ class CodeWriter:
 
     def __init__(self, indent: str = "  ", type_spec_class_name: ClassName | None = None):
         self.__indent = indent
+        self.__indent_cache = [""]
         self.__out = []  # Output buffer
         self.__indent_level = 0
         self.__line_start = True  # Are we at the start of a line?
@@ -68,44 +83,58 @@ class CodeWriter:
 
     def indent(self, count: int = 1) -> None:
         self.__indent_level += count
+        while len(self.__indent_cache) <= self.__indent_level:
+            self.__indent_cache.append(self.__indent_cache[-1] + self.__indent)
 
     def unindent(self, count: int = 1) -> None:
         if self.__indent_level > 0:
             self.__indent_level -= min(count, self.__indent_level)
 
     def emit(self, s: str | Constant, new_line_prefix: str = "") -> "CodeWriter":
-        if s.startswith("\n"):
-            if self.__line_start and new_line_prefix:
-                self.__out.append(self.__indent * self.__indent_level)
-                self.__out.append(new_line_prefix)
+        write = self.__out.append
 
-            # Reset line start
-            self.__out.append("\n")
-            self.__line_start = True
-            s = s[1:]
+        # Fast path: most emitted text is a single token without any newlines
+        if s and "\n" not in s:
+            if self.__line_start:
+                write(self.__indent_cache[self.__indent_level] + new_line_prefix + s)
+                self.__line_start = False
+            else:
+                write(s)
+            return self
 
-        if not s and not isinstance(s, Constant):
+        # Newlines are split into their own format parts by CodeBlock, so a bare "\n" is common too
+        if s == "\n":
+            # Blank lines only get the prefix, never trailing indentation
+            if self.__line_start and new_line_prefix:
+                write(self.__indent_cache[self.__indent_level] + new_line_prefix + "\n")
+            else:
+                write("\n")
+            self.__line_start = True
             return self
 
-        if self.__line_start:
-            # Add indentation at start of line
-            self.__out.append(self.__indent * self.__indent_level)
-            self.__out.append(new_line_prefix)
-            self.__line_start = False
+        # An empty Constant still starts a line (i.e. emits the indent and prefix)
+        emit_empty = not s and isinstance(s, Constant)
 
-        # Split by newlines to handle indentation
         lines = s.split("\n")
         for i, line in enumerate(lines):
             if i > 0:
-                # Emit newline and indentation
-                self.emit(f"\n{line}", new_line_prefix)
-            else:
-                # Emit the line
-                self.__out.append(line)
+                # Blank lines only get the prefix, never trailing indentation. The exception is
+                # text starting with "\n\n": its second (blank) line is indented too.
+                if self.__line_start and (new_line_prefix or (i == 2 and not lines[0] and not lines[1])):
+                    write(self.__indent_cache[self.__indent_level] + new_line_prefix + "\n")
+                else:
+                    write("\n")
+                self.__line_start = True
+
+            if not line and not emit_empty:
+                continue
 
-        # Update line start flag
-        if s.endswith("\n"):
-            self.__line_start = True
+            if self.__line_start:
+                # Add indentation at start of line
+                write(self.__indent_cache[self.__indent_level] + new_line_prefix + line)
+                self.__line_start = False
+            else:
+                write(line)
 
         return self
 
@@ -155,14 +184,14 @@ class CodeWriter:
         self.emit("}\n")
         return self
 
-    def exclude_scoped_class(self, class_name: str):
+    def exclude_scoped_class(self, class_name: str) -> None:
         """
         Define any inner classes here because any usage on the same level
         inherently references them
         """
         self.__excluded_scoped_classes[class_name] = self.__excluded_scoped_classes.get(class_name, 0) + 1
 
-    def unexclude_scoped_class(self, class_name: str):
+    def unexclude_scoped_class(self, class_name: str) -> None:
         self.__excluded_scoped_classes[class_name] = self.__excluded_scoped_classes.get(class_name, 0) - 1
         if self.__excluded_scoped_classes[class_name] < 0:
             raise ValueError(f"Class {class_name} has been unexcluded more times than it was excluded")
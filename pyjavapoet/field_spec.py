@@ -38,6 +38,15 @@ class FieldSpec(Code["FieldSpec"]):
     FieldSpec instances are immutable. Use the builder to create new instances.
     """
 
+    __slots__ = (
+        "type_name",
+        "name",
+        "modifiers",
+        "annotations",
+        "javadoc",
+        "initializer",
+    )
+
     def __init__(
         self,
         type_name: "TypeName",
@@ -138,6 +147,11 @@ class FieldSpec(Code["FieldSpec"]):
             self.__annotations.append(annotation_spec)
             return self
 
+        def add_annotations(self, *annotation_specs: "AnnotationSpec") -> "FieldSpec.Builder":
+            for annotation_spec in annotation_specs:
+                self.add_annotation(annotation_spec)
+            return self
+
         def add_javadoc(self, format_string: str, *args) -> "FieldSpec.Builder":
             self.__javadoc = CodeBlock.add_javadoc(self.__javadoc, format_string, *args)
             return self
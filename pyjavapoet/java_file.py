@@ -18,8 +18,10 @@ Modified by Matthew Au-Yeung on 2025-07-29; see changelog.md for more details.
 """
 
 import sys
-from io import StringIO
+from collections.abc import Collection, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, TextIO, Union
 
 from pyjavapoet.code_base import Code
@@ -42,15 +44,20 @@ class JavaFile(Code["JavaFile"]):
         type_spec: TypeSpec,
         file_comment: Optional[CodeBlock],
         indent: str,
-        static_imports: dict[ClassName, set[str]],
-        additional_imports: set[str],
+        static_imports: Mapping[ClassName, Collection[str]],
+        additional_imports: Collection[str],
     ):
         self.package_name = package_name
         self.type_spec = type_spec
         self.file_comment = file_comment
         self.indent = indent
-        self.static_imports = static_imports
-        self.additional_imports = additional_imports
+        # Frozen, since changing them would leave the cached rendering stale
+        self.static_imports: Mapping[ClassName, frozenset[str]] = MappingProxyType(
+            {class_name: frozenset(members) for class_name, members in static_imports.items()}
+        )
+        self.additional_imports = frozenset(additional_imports)
+        # JavaFile is immutable, so it is rendered at most once
+        self.__rendered: str | None = None
 
     def write_to_dir(self, java_dir: Path) -> Path:
         """
@@ -78,22 +85,15 @@ class JavaFile(Code["JavaFile"]):
             if parent := out.parent:
                 parent.mkdir(parents=True, exist_ok=True)
 
-            with open(out, "w") as f:
-                self.emit_to(f)
+            # Render first so the file gets a single write, and is not left truncated if rendering fails.
+            # Always UTF-8 with "\n" line endings, so the output is the same on every platform.
+            out.write_text(str(self), encoding="utf-8", newline="")
         else:
             # Write to file-like object
             self.emit_to(out)
 
     def emit_to(self, out: TextIO) -> None:
-        # Create a CodeWriter for generating the file
-        writer = CodeWriter(
-            indent=self.indent,
-            type_spec_class_name=ClassName.get(self.package_name, self.type_spec.name),
-        )
-        # Emit the file
-        self.emit(writer)
-        # Write to the output
-        out.write(str(writer))
+        out.write(str(self))
 
     def _extract_wildcard_imports(self) -> set[str]:
         """Extract wildcard package imports from additional imports.
@@ -112,7 +112,7 @@ class JavaFile(Code["JavaFile"]):
         return wildcard_packages
 
     def _merge_all_specific_imports(
-        self, collected_imports: dict[str, set[str]], wildcard_packages: set[str]
+        self, collected_imports: Mapping[str, frozenset[str]], wildcard_packages: set[str]
     ) -> dict[str, set[str]]:
         """Merge all specific imports (collected + additional) while excluding wildcard-covered packages.
 
@@ -147,7 +147,7 @@ class JavaFile(Code["JavaFile"]):
         return final_imports
 
     def _emit_all_imports(
-        self, code_writer: CodeWriter, final_imports: dict[str, set[str]], wildcard_packages: set[str]
+        self, code_writer: CodeWriter, final_imports: Mapping[str, Collection[str]], wildcard_packages: set[str]
     ) -> None:
         """Emit all import statements in the correct order.
 
@@ -158,39 +158,51 @@ class JavaFile(Code["JavaFile"]):
         """
         # Emit static imports first
         static_imports = sorted(
-            [
-                f"import static {type_name.canonical_name}.{member};"
-                for type_name, members in self.static_imports.items()
-                for member in sorted(members)
-            ]
+            f"import static {type_name.canonical_name}.{member};\n"
+            for type_name, members in self.static_imports.items()
+            for member in members
         )
-
         if static_imports:
-            for static_import in static_imports:
-                code_writer.emit(static_import)
-                code_writer.emit("\n")
-            code_writer.emit("\n")
-
-        # Combine wildcard and specific imports, then sort them together
-        all_imports = []
-
-        # Add wildcard imports
-        for package in wildcard_packages:
-            all_imports.append(f"import {package}.*;")
+            code_writer.emit("".join(static_imports) + "\n")
+
+        # Combine wildcard and specific imports, then sort them together. Both come from sets
+        # keyed by package, so there is nothing to de-duplicate here.
+        all_imports = [f"import {package}.*;\n" for package in wildcard_packages]
+        all_imports.extend(
+            f"import {package}.{simple_name};\n"
+            for package, simple_names in final_imports.items()
+            for simple_name in simple_names
+        )
 
-        # Add specific imports
-        for package in final_imports:
-            for simple_name in final_imports[package]:
-                all_imports.append(f"import {package}.{simple_name};")
+        # Emit the whole sorted block at once, with a blank line after it if there were any
+        if all_imports:
+            all_imports.sort()
+            code_writer.emit("".join(all_imports) + "\n")
+
+    def _resolve_imports(self) -> tuple[Mapping[str, Collection[str]], set[str]]:
+        """Resolve the specific imports (by package) and wildcard packages of this file."""
+        # Get the imports from type usage (cached on the TypeSpec) and process all imports
+        collected_imports = self.type_spec._get_imports(self.package_name)
+        if not self.additional_imports:
+            # Common case: the collected imports are already final
+            return collected_imports, set()
+        wildcard_packages = self._extract_wildcard_imports()
+        return self._merge_all_specific_imports(collected_imports, wildcard_packages), wildcard_packages
 
-        # Sort all imports alphabetically and emit them
-        for import_statement in sorted(all_imports):
-            code_writer.emit(import_statement)
-            code_writer.emit("\n")
+    def imports(self) -> list[str]:
+        """Return the sorted, non-static imports of this file without rendering it.
 
-        # Add blank line after imports if there were any
-        if all_imports:
-            code_writer.emit("\n")
+        i.e. ["java.util.*", "java.util.concurrent.Future"]
+        """
+        final_imports, wildcard_packages = self._resolve_imports()
+        result = [f"{package}.*" for package in wildcard_packages]
+        result.extend(
+            f"{package}.{simple_name}"
+            for package, simple_names in final_imports.items()
+            for simple_name in simple_names
+        )
+        result.sort()
+        return result
 
     def emit(self, code_writer: CodeWriter) -> None:
         # Emit file comment
@@ -202,41 +214,41 @@ class JavaFile(Code["JavaFile"]):
         if self.package_name:
             code_writer.emit(f"package {self.package_name};\n\n")
 
-        # Do a first pass to collect imports
-        import_collector = CodeWriter(
-            indent=self.indent,
-            type_spec_class_name=ClassName.get(self.package_name, self.type_spec.name),
-        )
-        self.type_spec.emit(import_collector)
-
-        # Get the imports from type usage and process all imports
-        collected_imports = import_collector.get_imports()
-        wildcard_packages = self._extract_wildcard_imports()
-        final_imports = self._merge_all_specific_imports(collected_imports, wildcard_packages)
-        self._emit_all_imports(code_writer, final_imports, wildcard_packages)
+        final_imports, wildcard_packages = self._resolve_imports()
+        if final_imports or wildcard_packages or self.static_imports:
+            self._emit_all_imports(code_writer, final_imports, wildcard_packages)
 
         # Emit the type
         self.type_spec.emit(code_writer)
         code_writer.emit("\n")
 
     def get_relative_path(self) -> Path:
-        package_path = Path(*self.package_name.split("."))
-        return package_path.joinpath(self.type_spec.name + ".java")
+        return _relative_path(self.package_name, self.type_spec.name)
 
     def to_builder(self) -> "Builder":
+        # The builder needs mutable copies of the frozen import collections
         return JavaFile.Builder(
             self.package_name,
             self.type_spec,
             self.file_comment,
             self.indent,
-            self.static_imports,
-            self.additional_imports,
+            {class_name: set(members) for class_name, members in self.static_imports.items()},
+            set(self.additional_imports),
         )
 
     def __str__(self) -> str:
-        with StringIO() as sio:
-            self.emit_to(sio)
-            return sio.getvalue()
+        if self.__rendered is None:
+            writer = CodeWriter(
+                indent=self.indent,
+                type_spec_class_name=ClassName.get(self.package_name, self.type_spec.name),
+            )
+            self.emit(writer)
+            self.__rendered = str(writer)
+        return self.__rendered
+
+    def __contains__(self, text: str) -> bool:
+        # Checks the cached rendering, so repeated checks against one file render it only once
+        return text in str(self)
 
     @staticmethod
     def builder(package_name: str, type_spec: TypeSpec) -> "Builder":
@@ -258,21 +270,27 @@ class JavaFile(Code["JavaFile"]):
         ):
             self.__package_name = package_name
             self.__type_spec = type_spec
-            self.__file_comment = file_comment
+            # File comment blocks are collected flat and joined once in build(), rather than
+            # nesting a new joined CodeBlock for every added line
+            self.__file_comment_parts: list[str] = [] if file_comment is None else ["$L"]
+            self.__file_comment_blocks: list[CodeBlock] = [] if file_comment is None else [file_comment]
             self.__indent = indent
             self.__static_imports = static_imports or {}
             self.__additional_imports = additional_imports or set()
 
         def add_file_comment(self, format_string: str = EMPTY_STRING, *args) -> "JavaFile.Builder":
-            self.__file_comment = CodeBlock.add_javadoc(self.__file_comment, format_string, *args)
+            self.__file_comment_parts.append("$L")
+            self.__file_comment_blocks.append(CodeBlock.of(format_string, *args))
             return self
 
         def add_file_comment_line(self, format_string: str = EMPTY_STRING, *args) -> "JavaFile.Builder":
-            self.__file_comment = CodeBlock.add_javadoc_line(self.__file_comment, format_string, *args)
-            return self
+            if self.__file_comment_blocks:
+                self.__file_comment_parts.append("\n")
+            return self.add_file_comment(format_string, *args)
 
         def indent(self, indent: str) -> "JavaFile.Builder":
-            self.__indent = indent
+            # Interned so every writer and indent prefix shares one string
+            self.__indent = sys.intern(indent)
             return self
 
         def add_static_import(self, constant_class: Union[ClassName, str], constant_name: str) -> "JavaFile.Builder":
@@ -302,11 +320,21 @@ class JavaFile(Code["JavaFile"]):
             return self
 
         def build(self) -> "JavaFile":
+            if len(self.__file_comment_blocks) > 1:
+                file_comment = CodeBlock(list(self.__file_comment_parts), list(self.__file_comment_blocks), {})
+            else:
+                file_comment = self.__file_comment_blocks[0] if self.__file_comment_blocks else None
             return JavaFile(
                 self.__package_name,
                 self.__type_spec,
-                self.__file_comment,
+                file_comment,
                 self.__indent,
                 self.__static_imports,
                 self.__additional_imports,
             )
+
+
+# The path depends only on the package and type name, and Path is immutable, so it can be shared
+@lru_cache(maxsize=1024)
+def _relative_path(package_name: str, type_name: str) -> Path:
+    return Path(*package_name.split("."), f"{type_name}.java")
@@ -37,6 +37,21 @@ class MethodSpec(Code["MethodSpec"]):
     MethodSpec instances are immutable. Use the builder to create new instances.
     """
 
+    __slots__ = (
+        "name",
+        "modifiers",
+        "parameters",
+        "return_type",
+        "exceptions",
+        "type_variables",
+        "javadoc",
+        "annotations",
+        "code",
+        "default_value",
+        "kind",
+        "in_interface",
+    )
+
     class Kind(Enum):
         """
         Kind of method (normal method, constructor, or compact constructor).
@@ -168,6 +183,26 @@ class MethodSpec(Code["MethodSpec"]):
             self.in_interface,
         )
 
+    def with_name(self, name: str) -> "MethodSpec":
+        """
+        Return a copy of this method with a different name. MethodSpec is immutable,
+        so every other field is shared with this instance rather than copied.
+        """
+        return MethodSpec(
+            name,
+            self.modifiers,
+            self.parameters,
+            self.return_type,
+            self.exceptions,
+            self.type_variables,
+            self.javadoc,
+            self.annotations,
+            self.code,
+            self.default_value,
+            self.kind,
+            self.in_interface,
+        )
+
     @staticmethod
     def method_builder(name: str) -> "Builder":
         return MethodSpec.Builder(name, MethodSpec.Kind.METHOD)
@@ -286,6 +321,11 @@ class MethodSpec(Code["MethodSpec"]):
             self.__annotations.append(annotation_spec)
             return self
 
+        def add_annotations(self, *annotation_specs: "AnnotationSpec") -> "MethodSpec.Builder":
+            for annotation_spec in annotation_specs:
+                self.add_annotation(annotation_spec)
+            return self
+
         def add_raw_code(self, format_string: str, *args) -> "MethodSpec.Builder":
             if self.__kind == MethodSpec.Kind.COMPACT_CONSTRUCTOR:
                 raise ValueError("Compact constructors cannot have a body")
@@ -373,6 +413,27 @@ class MethodSpec(Code["MethodSpec"]):
             self.__name = name
             return self
 
+        def copy(self) -> "MethodSpec.Builder":
+            """
+            Return an independent builder with the same state, e.g. to stamp out many similar
+            methods from one prototype. Collections are copied shallowly since their elements
+            (specs, type names and code blocks) are immutable.
+            """
+            return MethodSpec.Builder(
+                self.__name,
+                self.__kind,
+                set(self.__modifiers),
+                list(self.__parameters),
+                self.__return_type,
+                set(self.__exceptions),
+                list(self.__type_variables),
+                self.__javadoc,
+                list(self.__annotations),
+                self.__code_builder.copy(),
+                self.__default_value,
+                self.__in_interface,
+            )
+
         def build(self) -> "MethodSpec":
             # Set constructor name from enclosing class
             if self.__kind == MethodSpec.Kind.CONSTRUCTOR or self.__kind == MethodSpec.Kind.COMPACT_CONSTRUCTOR:
@@ -46,26 +46,7 @@ class Modifier(Enum):
 
     @staticmethod
     def ordered_modifiers(modifiers: set["Modifier"]) -> list["Modifier"]:
-        # Java modifier order: public, protected, private, abstract, static, final,
-        # transient, volatile, synchronized, native, strictfp, sealed, non-sealed, default
-        order = [
-            Modifier.PUBLIC,
-            Modifier.PROTECTED,
-            Modifier.PRIVATE,
-            Modifier.ABSTRACT,
-            Modifier.STATIC,
-            Modifier.FINAL,
-            Modifier.TRANSIENT,
-            Modifier.VOLATILE,
-            Modifier.SYNCHRONIZED,
-            Modifier.NATIVE,
-            Modifier.STRICTFP,
-            Modifier.SEALED,
-            Modifier.NON_SEALED,
-            Modifier.DEFAULT,
-        ]
-        order_map = {mod: i for i, mod in enumerate(order)}
-        return sorted(modifiers, key=lambda x: order_map.get(x, 100))
+        return sorted(modifiers, key=_MODIFIER_ORDER.__getitem__)
 
     @staticmethod
     def check_method_modifiers(modifiers):
@@ -93,3 +74,29 @@ class Modifier(Enum):
 
         if Modifier.SEALED in modifiers and Modifier.FINAL in modifiers:
             raise ValueError("Class cannot be both sealed and final")
+
+
+# Java modifier order: public, protected, private, abstract, static, final,
+# transient, volatile, synchronized, native, strictfp, sealed, non-sealed, default.
+# Built once here rather than on every ordered_modifiers call.
+_MODIFIER_ORDER = {
+    modifier: i
+    for i, modifier in enumerate(
+        (
+            Modifier.PUBLIC,
+            Modifier.PROTECTED,
+            Modifier.PRIVATE,
+            Modifier.ABSTRACT,
+            Modifier.STATIC,
+            Modifier.FINAL,
+            Modifier.TRANSIENT,
+            Modifier.VOLATILE,
+            Modifier.SYNCHRONIZED,
+            Modifier.NATIVE,
+            Modifier.STRICTFP,
+            Modifier.SEALED,
+            Modifier.NON_SEALED,
+            Modifier.DEFAULT,
+        )
+    )
+}
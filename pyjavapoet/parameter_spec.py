@@ -37,6 +37,17 @@ class ParameterSpec(Code["ParameterSpec"]):
     ParameterSpec instances are immutable. Use the builder to create new instances.
     """
 
+    __slots__ = (
+        "type_name",
+        "name",
+        "modifiers",
+        "annotations",
+        "varargs",
+    )
+
+    # Receiver parameters are named "this" or "Outer.this"
+    receiver_match = re.compile(r"(?:[A-Za-z_][A-Za-z0-9_]*\.)?this\Z")
+
     def __init__(
         self,
         type_name: "TypeName",
@@ -81,12 +92,14 @@ class ParameterSpec(Code["ParameterSpec"]):
         code_writer.emit(self.name)
 
     def to_builder(self) -> "ParameterSpec.Builder":
-        return ParameterSpec.Builder(self.type_name, self.name, self.modifiers, self.annotations, self.varargs)
+        # The builder gets its own collections, so adding to it cannot change this spec
+        return ParameterSpec.Builder(
+            self.type_name, self.name, deep_copy(self.modifiers), deep_copy(self.annotations), self.varargs
+        )
 
     @staticmethod
     def builder(type_name: Union["TypeName", str, type], name: str) -> "Builder":
-        receiver_pattern = r"^(?:[A-Za-z_][A-Za-z0-9_]*\.)?this$"
-        if not re.match(receiver_pattern, name):
+        if not ParameterSpec.receiver_match.match(name):
             throw_if_invalid_java_identifier(name)
 
         if not isinstance(type_name, TypeName):
@@ -120,6 +133,11 @@ class ParameterSpec(Code["ParameterSpec"]):
             self.annotations.append(annotation_spec)
             return self
 
+        def add_annotations(self, *annotation_specs: "AnnotationSpec") -> "ParameterSpec.Builder":
+            for annotation_spec in annotation_specs:
+                self.add_annotation(annotation_spec)
+            return self
+
         def set_varargs(self, varargs: bool = True) -> "ParameterSpec.Builder":
             self.varargs = varargs
             return self
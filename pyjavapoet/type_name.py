@@ -18,9 +18,11 @@ Modified by Matthew Au-Yeung on 2025-07-29; see changelog.md for more details.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union
+from weakref import WeakValueDictionary
 
-from pyjavapoet.util import deep_copy, is_ascii_upper
+from pyjavapoet.util import deep_copy
 
 if TYPE_CHECKING:
     from pyjavapoet.annotation_spec import AnnotationSpec
@@ -34,6 +36,8 @@ class TypeName(ABC):
     Base class for types in Java's type system.
     """
 
+    __slots__ = ("annotations", "__rendered", "__hash")
+
     # Primitive types mapping
     PRIMITIVE_TYPES = {
         "boolean": "Boolean",
@@ -47,17 +51,19 @@ class TypeName(ABC):
         "void": "Void",
     }
 
-    BOXED_PRIMITIVE_TYPES = {
-        "Boolean",
-        "Byte",
-        "Character",
-        "Double",
-        "Float",
-        "Integer",
-        "Long",
-        "Short",
-        "Void",
-    }
+    BOXED_PRIMITIVE_TYPES = frozenset(
+        {
+            "Boolean",
+            "Byte",
+            "Character",
+            "Double",
+            "Float",
+            "Integer",
+            "Long",
+            "Short",
+            "Void",
+        }
+    )
 
     ALL_PRIMITIVE_TYPES = (
         {
@@ -70,6 +76,10 @@ class TypeName(ABC):
 
     def __init__(self, annotations: list["AnnotationSpec"] | None = None):
         self.annotations = annotations or []
+        # Context-free rendering and its hash, used by __str__, __eq__ and __hash__. Both are
+        # kept since TypeNames are immutable.
+        self.__rendered: str | None = None
+        self.__hash: int | None = None
 
     @abstractmethod
     def emit(self, code_writer: "CodeWriter") -> None:
@@ -85,33 +95,33 @@ class TypeName(ABC):
         pass
 
     def __str__(self) -> str:
-        from pyjavapoet.code_writer import CodeWriter
+        if self.__rendered is None:
+            from pyjavapoet.code_writer import CodeWriter
 
-        writer = CodeWriter()
-        self.emit(writer)
-        return str(writer)
+            writer = CodeWriter()
+            self.emit(writer)
+            self.__rendered = str(writer)
+        return self.__rendered
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TypeName):
             return False
         return str(self) == str(other)
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self.__hash is None:
+            self.__hash = hash(str(self))
+        return self.__hash
 
     def is_primitive(self) -> bool:
-        return (
-            isinstance(self, ClassName)
-            and not self.package_name
-            and ClassName.strip_simple_name(self.simple_name) in TypeName.PRIMITIVE_TYPES
-        )
+        # Overridden by ClassName, the only TypeName that can be a primitive
+        return False
 
     def is_boxed_primitive(self) -> bool:
-        return (
-            isinstance(self, ClassName)
-            and self.package_name == JAVA_LANG_PACKAGE
-            and ClassName.strip_simple_name(self.simple_name) in TypeName.BOXED_PRIMITIVE_TYPES
-        )
+        # Overridden by ClassName, the only TypeName that can be a boxed primitive
+        return False
 
     def is_any_primitive(self) -> bool:
         if not isinstance(self, ClassName):
@@ -133,6 +143,11 @@ class TypeName(ABC):
             return type_mirror_or_name
 
         if isinstance(type_mirror_or_name, str):
+            # Plain primitive names ("int", "boolean", ...) map straight to their ClassName constants
+            primitive = _PRIMITIVE_TYPE_NAMES.get(type_mirror_or_name)
+            if primitive is not None:
+                return primitive
+
             # Check if it's a primitive type
             if ClassName.strip_simple_name(type_mirror_or_name) in TypeName.ALL_PRIMITIVE_TYPES:
                 # Create primitive type
@@ -141,28 +156,28 @@ class TypeName(ABC):
             # Parse the string as a fully qualified class name
             return ClassName.get_from_fqcn(type_mirror_or_name)
 
-        # Handle Python types
+        # Handle Python types, defaulting to Java Object for unmapped ones
         if isinstance(type_mirror_or_name, type):
-            # Map Python types to Java types
-            type_mapping = {
-                bool: ClassName.BOOLEAN,
-                int: ClassName.INTEGER,
-                float: ClassName.FLOAT,
-                str: ClassName.STRING,
-                list: ClassName.LIST,
-                dict: ClassName.MAP,
-                set: ClassName.SET,
-                tuple: ClassName.LIST,
-            }
-
-            if type_mirror_or_name in type_mapping:
-                return TypeName.get(type_mapping[type_mirror_or_name])
-            else:
-                # Default to Java Object for other Python types
-                return ClassName.OBJECT
+            return _PYTHON_TYPE_MAPPING.get(type_mirror_or_name, ClassName.OBJECT)
 
 
 class ClassName(TypeName):
+    __slots__ = (
+        "package_name",
+        "simple_names",
+        "ignore_import",
+        "nested_name",
+        "canonical_name",
+        "reflection_name",
+        "enclosing_class_name",
+        "top_level_class_name",
+        "__hash",
+        "__primitive",
+        "__boxed_primitive",
+        # Needed for the ClassName.get intern cache
+        "__weakref__",
+    )
+
     INTEGER: "ClassName"
     LONG: "ClassName"
     DOUBLE: "ClassName"
@@ -218,6 +233,11 @@ class ClassName(TypeName):
     package_name: str
     simple_names: list[str]
     ignore_import: bool
+    nested_name: str
+    canonical_name: str
+    reflection_name: str
+    enclosing_class_name: Optional["ClassName"]
+    top_level_class_name: "ClassName"
 
     def __init__(self, package_name: str, simple_names: list[str], annotations: list["AnnotationSpec"] | None = None):
         super().__init__(annotations)
@@ -226,7 +246,30 @@ class ClassName(TypeName):
 
         self.package_name = package_name
         self.simple_names = simple_names
+
+        # ClassName is never mutated after construction, so the derived names are computed once
+        package_prefix = package_name + "." if package_name else ""
+        self.nested_name = ".".join(simple_names)
+        self.canonical_name = package_prefix + self.nested_name
+        self.reflection_name = package_prefix + "$".join(simple_names)
+        self.__hash = hash(self.canonical_name)
+        # The enclosing class goes through the intern cache, so nested classes of one outer class
+        # share it. Without a package it is built directly, as get() would remap e.g. "String".
+        if len(simple_names) == 1:
+            self.enclosing_class_name = None
+        elif package_name:
+            self.enclosing_class_name = ClassName.get(package_name, *simple_names[:-1])
+        else:
+            self.enclosing_class_name = ClassName(package_name, simple_names[:-1])
+        self.top_level_class_name = self.enclosing_class_name if package_name and self.enclosing_class_name else self
+
+        # CodeWriter.emit_type asks these for every type reference it resolves, so they are precomputed
+        stripped_simple_name = ClassName.strip_simple_name(self.simple_name)
         self.ignore_import = package_name == JAVA_LANG_PACKAGE or self.is_any_primitive()
+        self.__primitive = not package_name and stripped_simple_name in TypeName.PRIMITIVE_TYPES
+        self.__boxed_primitive = (
+            package_name == JAVA_LANG_PACKAGE and stripped_simple_name in TypeName.BOXED_PRIMITIVE_TYPES
+        )
 
     def emit(self, code_writer: "CodeWriter") -> None:
         # Emit annotations if any
@@ -237,6 +280,12 @@ class ClassName(TypeName):
         # Emit class name
         code_writer.emit_type(self)
 
+    def is_primitive(self) -> bool:
+        return self.__primitive
+
+    def is_boxed_primitive(self) -> bool:
+        return self.__boxed_primitive
+
     def copy(self) -> "ClassName":
         return ClassName(self.package_name, deep_copy(self.simple_names), deep_copy(self.annotations))
 
@@ -247,37 +296,18 @@ class ClassName(TypeName):
         return ClassName(self.package_name, self.simple_names[:-1] + list(simple_names))
 
     def with_type_arguments(self, *type_arguments: Union["TypeName", str, type]) -> "ParameterizedTypeName":
-        return ParameterizedTypeName(self, [TypeName.get(arg) for arg in type_arguments])
+        return ParameterizedTypeName.get(self, *type_arguments)
 
     def array(self) -> "ArrayTypeName":
         """Return an array type with this class as the component type."""
         return ArrayTypeName(self)
 
     def to_type_param(self) -> "TypeName":
-        if self.is_primitive():
-            boxed_name = TypeName.PRIMITIVE_TYPES[self.simple_name]
-            package_name = TypeName.ALL_PRIMITIVE_TYPES[boxed_name]
-            return ClassName.get(package_name, boxed_name)
+        if self.__primitive:
+            # Primitive arrays such as int[] are already reference types and stay as they are
+            return _BOXED_TYPE_NAMES.get(self.simple_name, self)
         return self
 
-    @property
-    def reflection_name(self) -> str:
-        if not self.package_name:
-            return "$".join(self.simple_names)
-        return self.package_name + "." + "$".join(self.simple_names)
-
-    @property
-    def enclosing_class_name(self) -> Optional["ClassName"]:
-        if len(self.simple_names) == 1:
-            return None
-        return ClassName(self.package_name, self.simple_names[:-1])
-
-    @property
-    def top_level_class_name(self) -> "ClassName":
-        if not self.package_name:
-            return self
-        return ClassName(self.package_name, self.simple_names[:-1] or self.simple_names)
-
     @property
     def simple_name(self) -> str:
         return self.simple_names[-1]
@@ -286,19 +316,19 @@ class ClassName(TypeName):
     def top_simple_name(self) -> str:
         return self.simple_names[0]
 
-    @property
-    def nested_name(self) -> str:
-        return ".".join(self.simple_names)
-
-    @property
-    def canonical_name(self) -> str:
-        if not self.package_name:
-            return ".".join(self.simple_names)
-        return f"{self.package_name}.{self.nested_name}"
-
     def __str__(self) -> str:
         return self.canonical_name
 
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, ClassName):
+            return self.canonical_name == other.canonical_name
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
     @staticmethod
     def strip_simple_name(simple_name: str) -> str:
         if simple_name.endswith("[]"):
@@ -309,6 +339,16 @@ class ClassName(TypeName):
 
     @staticmethod
     def get(package_name: str, *simple_names: str) -> "ClassName":
+        # ClassNames are interned, so asking for the same class twice returns the same instance
+        key = (package_name, simple_names)
+        class_name = _CLASS_NAME_CACHE.get(key)
+        if class_name is None:
+            class_name = ClassName.__create(package_name, *simple_names)
+            _CLASS_NAME_CACHE[key] = class_name
+        return class_name
+
+    @staticmethod
+    def __create(package_name: str, *simple_names: str) -> "ClassName":
         # Handle nested classes
         all_simple_names = []
         for simple_name in simple_names:
@@ -326,24 +366,31 @@ class ClassName(TypeName):
 
     @staticmethod
     def get_from_fqcn(fully_qualified_class_name: str) -> "ClassName":
+        return _class_name_from_fqcn(fully_qualified_class_name)
+
+    @staticmethod
+    def _parse_fqcn(fully_qualified_class_name: str) -> "ClassName":
         if "." not in fully_qualified_class_name:
             return ClassName.get("", fully_qualified_class_name)
 
         parts = fully_qualified_class_name.split(".")
-        package_parts = []
-        class_parts = []
 
-        # Heuristic: assume parts with lowercase first letter are package parts
-        for part in parts:
-            if class_parts or (part and is_ascii_upper(part[0])):
-                class_parts.append(part)
-            else:
-                package_parts.append(part)
+        # Heuristic: the first part starting with an ASCII uppercase letter begins the class names,
+        # everything before it is the package
+        for i, part in enumerate(parts):
+            if "A" <= part[:1] <= "Z":
+                return ClassName.get(".".join(parts[:i]), *parts[i:])
+
+        return ClassName.get(".".join(parts[:-1]), parts[-1])
+
+
+_CLASS_NAME_CACHE: WeakValueDictionary[tuple[str, tuple[str, ...]], ClassName] = WeakValueDictionary()
 
-        if class_parts:
-            return ClassName.get(".".join(package_parts), *class_parts)
-        else:
-            return ClassName.get(".".join(package_parts[:-1]), package_parts[-1])
+
+# Type strings such as "java.util.List" repeat a lot, so their parsed ClassName is kept
+@lru_cache(maxsize=4096)
+def _class_name_from_fqcn(fully_qualified_class_name: str) -> ClassName:
+    return ClassName._parse_fqcn(fully_qualified_class_name)
 
 
 class ArrayTypeName(TypeName):
@@ -351,6 +398,8 @@ class ArrayTypeName(TypeName):
     Represents an array type.
     """
 
+    __slots__ = ("component_type",)
+
     def __init__(self, component_type: TypeName, annotations: list["AnnotationSpec"] | None = None):
         super().__init__(annotations)
         self.component_type = component_type
@@ -380,6 +429,9 @@ class ParameterizedTypeName(TypeName):
     Represents a parameterized type like List<String>.
     """
 
+    # __weakref__ is needed for the ParameterizedTypeName.get intern cache
+    __slots__ = ("raw_type", "type_arguments", "owner_type", "__weakref__")
+
     def __init__(
         self,
         raw_type: ClassName,
@@ -441,7 +493,23 @@ class ParameterizedTypeName(TypeName):
             raw_type = ClassName.get_from_fqcn(raw_type)
 
         type_args = [TypeName.get(arg) for arg in type_arguments]
-        return ParameterizedTypeName(raw_type, type_args)
+        if raw_type.annotations or not all(type(arg) is ClassName and not arg.annotations for arg in type_args):
+            return ParameterizedTypeName(raw_type, type_args)
+
+        # Types made only of plain class names (e.g. List<String>) are interned, so repeated
+        # requests share one instance and its cached rendering
+        # Reflection names also tell a nested class apart from a same-named package ("a.B$C" vs "a.B.C")
+        key = (raw_type.reflection_name, tuple(arg.reflection_name for arg in type_args))
+        parameterized_type_name = _PARAMETERIZED_TYPE_NAME_CACHE.get(key)
+        if parameterized_type_name is None:
+            parameterized_type_name = ParameterizedTypeName(raw_type, type_args)
+            _PARAMETERIZED_TYPE_NAME_CACHE[key] = parameterized_type_name
+        return parameterized_type_name
+
+
+_PARAMETERIZED_TYPE_NAME_CACHE: WeakValueDictionary[tuple[str, tuple[str, ...]], ParameterizedTypeName] = (
+    WeakValueDictionary()
+)
 
 
 class TypeVariableName(TypeName):
@@ -449,6 +517,8 @@ class TypeVariableName(TypeName):
     Represents a type variable like T in List<T>.
     """
 
+    __slots__ = ("name", "bounds")
+
     def __init__(
         self,
         name: str,
@@ -492,6 +562,8 @@ class WildcardTypeName(TypeName):
     Represents a wildcard type like ? extends Number or ? super String.
     """
 
+    __slots__ = ("upper_bounds", "lower_bounds")
+
     def __init__(
         self,
         upper_bounds: list[TypeName] | None = None,
@@ -592,3 +664,23 @@ ClassName.UUID = ClassName.get("java.util", "UUID")
 ClassName.OBJECTS = ClassName.get("java.util", "Objects")
 ClassName.STRING_BUILDER = ClassName.get("java.lang", "StringBuilder")
 ClassName.STRING_BUFFER = ClassName.get("java.lang", "StringBuffer")
+
+# Map Python types to Java types
+_PYTHON_TYPE_MAPPING: dict[type, TypeName] = {
+    bool: ClassName.BOOLEAN,
+    int: ClassName.INTEGER,
+    float: ClassName.FLOAT,
+    str: ClassName.STRING,
+    list: ClassName.LIST,
+    dict: ClassName.MAP,
+    set: ClassName.SET,
+    tuple: ClassName.LIST,
+}
+
+# Primitive type names by their Java keyword, checked first by TypeName.get
+_PRIMITIVE_TYPE_NAMES: dict[str, ClassName] = {name: ClassName.get("", name) for name in TypeName.PRIMITIVE_TYPES}
+
+# Boxed java.lang ClassName by primitive keyword, used by ClassName.to_type_param
+_BOXED_TYPE_NAMES: dict[str, ClassName] = {
+    name: ClassName.get(JAVA_LANG_PACKAGE, boxed_name) for name, boxed_name in TypeName.PRIMITIVE_TYPES.items()
+}
@@ -17,7 +17,9 @@ Modified by Matthew Au-Yeung on 2025-07-29; see changelog.md for more details.
 - Similar APIs ported from Java to Python.
 """
 
+from collections.abc import Mapping
 from enum import Enum, auto
+from types import MappingProxyType
 from typing import Optional, Union
 
 from pyjavapoet.annotation_spec import AnnotationSpec
@@ -39,6 +41,27 @@ class TypeSpec(Code["TypeSpec"]):
     TypeSpec instances are immutable. Use the builder to create new instances.
     """
 
+    __slots__ = (
+        "name",
+        "kind",
+        "modifiers",
+        "type_variables",
+        "superclass",
+        "superinterfaces",
+        "permitted_subclasses",
+        "javadoc",
+        "annotations",
+        "fields",
+        "methods",
+        "types",
+        "enum_constants",
+        "record_components",
+        "anonymous_class_format",
+        "anonymous_class_args",
+        "_sorted_modifiers",
+        "__imports_by_package",
+    )
+
     class Kind(Enum):
         """
         Kind of type (class, interface, enum, annotation, or record).
@@ -70,6 +93,9 @@ class TypeSpec(Code["TypeSpec"]):
     anonymous_class_format: str
     anonymous_class_args: list
 
+    # Modifiers in declaration order, computed once since TypeSpec is immutable
+    _sorted_modifiers: tuple["Modifier", ...]
+
     def __init__(
         self,
         name: str,
@@ -101,6 +127,9 @@ class TypeSpec(Code["TypeSpec"]):
         self.types = types
         self.enum_constants = enum_constants
         self.record_components = record_components
+        self._sorted_modifiers = tuple(Modifier.ordered_modifiers(modifiers))
+        # Imports needed as a top-level type, by package name (see _get_imports)
+        self.__imports_by_package: dict[str, Mapping[str, frozenset[str]]] = {}
 
         # For anonymous classes
         self.anonymous_class_format = ""
@@ -153,44 +182,33 @@ class TypeSpec(Code["TypeSpec"]):
             annotation.emit(code_writer)
             code_writer.emit("\n")
 
-        # Emit modifiers
-        for modifier in Modifier.ordered_modifiers(self.modifiers):
-            code_writer.emit(modifier.value)
-            code_writer.emit(" ")
-
-        # Emit kind
-        if self.kind == TypeSpec.Kind.CLASS:
-            code_writer.emit("class")
-        elif self.kind == TypeSpec.Kind.INTERFACE:
-            code_writer.emit("interface")
-        elif self.kind == TypeSpec.Kind.ENUM:
-            code_writer.emit("enum")
-        elif self.kind == TypeSpec.Kind.ANNOTATION:
-            code_writer.emit("@interface")
-        elif self.kind == TypeSpec.Kind.RECORD:
-            code_writer.emit("record")
-
-        # Emit name and type variables
-        code_writer.emit(" ")
-        code_writer.emit(self.name)
+        # Emit modifiers, kind and name. None of these reference types, so the
+        # header is joined up front and emitted in one call.
+        parts = [modifier.value + " " for modifier in self._sorted_modifiers]
+        parts.append(_KIND_KEYWORDS[self.kind])
+        parts.append(" ")
+        parts.append(self.name)
+        code_writer.emit("".join(parts))
 
+        # Emit type variables
         if self.type_variables:
             code_writer.emit("<")
-            for i, type_variable in enumerate(self.type_variables):
-                if i > 0:
-                    code_writer.emit(", ")
+            self.type_variables[0].emit(code_writer)
+            for type_variable in self.type_variables[1:]:
+                code_writer.emit(", ")
                 type_variable.emit(code_writer)
             code_writer.emit(">")
 
         # Emit record components
         if self.kind == TypeSpec.Kind.RECORD:
             code_writer.emit("(")
-            for i, (type_name, name) in enumerate(self.record_components):
-                if i > 0:
-                    code_writer.emit(", ")
+            separator = ""
+            for type_name, name in self.record_components:
+                code_writer.emit(separator)
                 code_writer.emit_type(type_name)
                 code_writer.emit(" ")
                 code_writer.emit(name)
+                separator = ", "
             code_writer.emit(")")
 
         # Emit superclass
@@ -206,93 +224,78 @@ class TypeSpec(Code["TypeSpec"]):
                 else " extends "
             )
             code_writer.emit(keyword)
-            for i, superinterface in enumerate(self.superinterfaces):
-                if i > 0:
-                    code_writer.emit(", ")
-                code_writer.emit_type(superinterface)
+            self.__emit_type_list(code_writer, self.superinterfaces)
 
         # Emit permitted subclasses
         if self.permitted_subclasses:
             code_writer.emit(" permits ")
-            for i, subclass in enumerate(self.permitted_subclasses):
-                if i > 0:
-                    code_writer.emit(", ")
-                code_writer.emit_type(subclass)
+            self.__emit_type_list(code_writer, self.permitted_subclasses)
 
         code_writer.emit(" {\n")
         code_writer.indent()
 
+        fields = self.fields
+        methods = self.methods
+        types = self.types
+        has_members_after_fields = bool(methods or types)
+
         # Emit enum constants
         if self.kind == TypeSpec.Kind.ENUM and self.enum_constants:
-            for i, (name, constant) in enumerate(self.enum_constants.items()):
-                if i > 0:
-                    code_writer.emit(",\n")
-
-                # Emit constant annotations
-                for annotation in constant.annotations:
-                    code_writer.emit("\n")
-                    annotation.emit(code_writer)
+            constants = iter(self.enum_constants.items())
+            self.__emit_enum_constant(code_writer, *next(constants))
+            for name, constant in constants:
+                code_writer.emit(",\n")
+                self.__emit_enum_constant(code_writer, name, constant)
 
-                code_writer.emit(name)
-
-                # If this is an anonymous class
-                if constant.anonymous_class_format or constant.fields or constant.methods:
-                    # Emit constructor arguments
-                    if constant.anonymous_class_format:
-                        code_writer.emit("(")
-                        code_block = CodeBlock.of(constant.anonymous_class_format, *constant.anonymous_class_args)
-                        code_block.emit(code_writer)
-                        code_writer.emit(")")
-
-                    # Emit class body
-                    code_writer.emit(" {\n")
-                    code_writer.indent()
-
-                    # Emit fields
-                    for field in constant.fields:
-                        field.emit(code_writer)
-                        code_writer.emit("\n")
-
-                    # Emit methods
-                    for method in constant.methods:
-                        method.emit(code_writer)
-                        code_writer.emit("\n")
-
-                    code_writer.unindent()
-                    code_writer.emit("}")
-
-            if self.fields or self.methods or self.types:
+            if fields or has_members_after_fields:
                 code_writer.emit(";\n\n")
             else:
                 code_writer.emit("\n")
 
         # Emit fields
-        for field in self.fields:
+        for field in fields:
             field.emit(code_writer)
 
-        if self.fields and (self.methods or self.types):
+        if fields and has_members_after_fields:
             code_writer.emit("\n")
 
         # Emit methods
-        for i, method in enumerate(self.methods):
-            method.emit(code_writer)
-            if i < len(self.methods) - 1:
+        if methods:
+            methods[0].emit(code_writer)
+            for method in methods[1:]:
                 code_writer.emit("\n")
+                method.emit(code_writer)
 
-        if self.methods and self.types:
-            code_writer.emit("\n")
+            if types:
+                code_writer.emit("\n")
 
         # Emit nested types
-        for i, type_spec in enumerate(self.types):
-            type_spec.emit(code_writer)
+        if types:
+            types[0].emit(code_writer)
             code_writer.emit("\n")
-            if i < len(self.types) - 1:
+            for type_spec in types[1:]:
+                code_writer.emit("\n")
+                type_spec.emit(code_writer)
                 code_writer.emit("\n")
 
         code_writer.unindent()
         code_writer.emit("}")
         self.__unexclude_direct_inner_classes(code_writer)
 
+    def _get_imports(self, package_name: str) -> Mapping[str, frozenset[str]]:
+        """
+        Return the imports (package -> simple names) this type needs when emitted as a top-level
+        type in package_name. Collecting them takes a full emit, so the result is cached read-only.
+        """
+        imports = self.__imports_by_package.get(package_name)
+        if imports is None:
+            import_collector = CodeWriter(type_spec_class_name=ClassName.get(package_name, self.name))
+            self.emit(import_collector)
+            imports = self.__imports_by_package[package_name] = MappingProxyType(
+                {package: frozenset(simple_names) for package, simple_names in import_collector.get_imports().items()}
+            )
+        return imports
+
     def to_builder(self) -> "Builder":
         return TypeSpec.Builder(
             self.name,
@@ -319,6 +322,48 @@ class TypeSpec(Code["TypeSpec"]):
         for type_spec in self.types:
             code_writer.unexclude_scoped_class(type_spec.name)
 
+    @staticmethod
+    def __emit_type_list(code_writer: "CodeWriter", type_names: list["TypeName"]) -> None:
+        code_writer.emit_type(type_names[0])
+        for type_name in type_names[1:]:
+            code_writer.emit(", ")
+            code_writer.emit_type(type_name)
+
+    @staticmethod
+    def __emit_enum_constant(code_writer: "CodeWriter", name: str, constant: "TypeSpec") -> None:
+        # Emit constant annotations
+        for annotation in constant.annotations:
+            code_writer.emit("\n")
+            annotation.emit(code_writer)
+
+        code_writer.emit(name)
+
+        # If this is an anonymous class
+        if constant.anonymous_class_format or constant.fields or constant.methods:
+            # Emit constructor arguments
+            if constant.anonymous_class_format:
+                code_writer.emit("(")
+                code_block = CodeBlock.of(constant.anonymous_class_format, *constant.anonymous_class_args)
+                code_block.emit(code_writer)
+                code_writer.emit(")")
+
+            # Emit class body
+            code_writer.emit(" {\n")
+            code_writer.indent()
+
+            # Emit fields
+            for field in constant.fields:
+                field.emit(code_writer)
+                code_writer.emit("\n")
+
+            # Emit methods
+            for method in constant.methods:
+                method.emit(code_writer)
+                code_writer.emit("\n")
+
+            code_writer.unindent()
+            code_writer.emit("}")
+
     @staticmethod
     def builder(name: str) -> "Builder":
         return TypeSpec.Builder(name, TypeSpec.Kind.CLASS)
@@ -355,6 +400,24 @@ class TypeSpec(Code["TypeSpec"]):
         Builder for TypeSpec instances.
         """
 
+        __slots__ = (
+            "__name",
+            "__kind",
+            "__modifiers",
+            "__type_variables",
+            "__superclass_field",
+            "__superinterfaces",
+            "__permitted_subclasses",
+            "__javadoc",
+            "__annotations",
+            "__fields",
+            "__methods",
+            "__types",
+            "__enum_constants",
+            "__record_components",
+            "__consumed",
+        )
+
         # Private fields defined at the top
         __name: str
         __kind: "TypeSpec.Kind"
@@ -370,6 +433,7 @@ class TypeSpec(Code["TypeSpec"]):
         __types: list["TypeSpec"]
         __enum_constants: dict[str, "TypeSpec"]
         __record_components: list[tuple[TypeName, str]]
+        __consumed: bool
 
         def __init__(
             self,
@@ -402,18 +466,20 @@ class TypeSpec(Code["TypeSpec"]):
             self.__types = types or []
             self.__enum_constants = enum_constants or {}
             self.__record_components = record_components or []
+            self.__consumed = False
 
         def add_modifiers(self, *modifiers: Modifier) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__modifiers.update(modifiers)
-            # Check if modifiers are valid for classes
-            Modifier.check_class_modifiers(self.__modifiers)
             return self
 
         def add_type_variable(self, type_variable: TypeVariableName) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__type_variables.append(type_variable)
             return self
 
         def superclass(self, superclass: Union["TypeName", str, type]) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if self.__kind == TypeSpec.Kind.INTERFACE or self.__kind == TypeSpec.Kind.ANNOTATION:
                 raise ValueError("Interfaces and annotations cannot have a superclass")
 
@@ -424,6 +490,7 @@ class TypeSpec(Code["TypeSpec"]):
             return self
 
         def add_superinterface(self, superinterface: Union["TypeName", str, type]) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if not isinstance(superinterface, TypeName):
                 superinterface = TypeName.get(superinterface)
 
@@ -431,6 +498,7 @@ class TypeSpec(Code["TypeSpec"]):
             return self
 
         def add_permitted_subclass(self, subclass: Union["TypeName", str, type]) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if not isinstance(subclass, TypeName):
                 subclass = TypeName.get(subclass)
 
@@ -438,25 +506,35 @@ class TypeSpec(Code["TypeSpec"]):
             return self
 
         def add_javadoc(self, format_string: str, *args) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__javadoc = CodeBlock.add_javadoc(self.__javadoc, format_string, *args)
             return self
 
         def add_javadoc_line(self, format_string: str = EMPTY_STRING, *args) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__javadoc = CodeBlock.add_javadoc_line(self.__javadoc, format_string, *args)
             return self
 
         def add_annotation(self, annotation_spec: AnnotationSpec) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__annotations.append(annotation_spec)
             return self
 
+        def add_annotations(self, *annotation_specs: AnnotationSpec) -> "TypeSpec.Builder":
+            for annotation_spec in annotation_specs:
+                self.add_annotation(annotation_spec)
+            return self
+
         def add_field(self, field_spec: FieldSpec) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__fields.append(field_spec)
             return self
 
         def add_method(self, method_spec: MethodSpec) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             # set constructor name to class name
             if method_spec.kind in (MethodSpec.Kind.CONSTRUCTOR, MethodSpec.Kind.COMPACT_CONSTRUCTOR):
-                method_spec = method_spec.to_builder().set_name(self.__name).build()
+                method_spec = method_spec.with_name(self.__name)
 
             if self.__kind == TypeSpec.Kind.INTERFACE:
                 method_spec = method_spec.to_builder().in_interface().build()
@@ -465,10 +543,12 @@ class TypeSpec(Code["TypeSpec"]):
             return self
 
         def add_type(self, type_spec: "TypeSpec") -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             self.__types.append(type_spec)
             return self
 
         def add_enum_constant(self, name: str) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if self.__kind != TypeSpec.Kind.ENUM:
                 raise ValueError("Enum constants can only be added to enums")
 
@@ -479,6 +559,7 @@ class TypeSpec(Code["TypeSpec"]):
             return self
 
         def add_enum_constant_with_class_body(self, name: str, type_spec: "TypeSpec") -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if self.__kind != TypeSpec.Kind.ENUM:
                 raise ValueError("Enum constants can only be added to enums")
 
@@ -488,6 +569,7 @@ class TypeSpec(Code["TypeSpec"]):
         def add_record_component(
             self, type_or_param: Union["ParameterSpec", "TypeName", str, type], name: Optional[str] = None
         ) -> "TypeSpec.Builder":
+            self.__check_not_consumed()
             if self.__kind != TypeSpec.Kind.RECORD:
                 raise ValueError("Record components can only be added to records")
 
@@ -507,12 +589,40 @@ class TypeSpec(Code["TypeSpec"]):
             self.__record_components.append((component_type, component_name))
             return self
 
-        def build(self) -> "TypeSpec":
+        def build(self, one_shot: bool = False) -> "TypeSpec":
+            """
+            Build the TypeSpec. Pass one_shot=True to move the builder's contents into the
+            TypeSpec instead of deep copying them; the builder can no longer be used afterwards.
+            """
+            self.__check_not_consumed()
+
+            # Check if modifiers are valid for classes
+            Modifier.check_class_modifiers(self.__modifiers)
+
             # Default superclass for enums
             if self.__kind == TypeSpec.Kind.ENUM and self.__superclass_field is None:
                 # For now, just use a simple enum superclass without parameterization
                 self.__superclass_field = ClassName.get("java.lang", "Enum")
 
+            if one_shot:
+                self.__consumed = True
+                return TypeSpec(
+                    self.__name,
+                    self.__kind,
+                    self.__modifiers,
+                    self.__type_variables,
+                    self.__superclass_field,
+                    self.__superinterfaces,
+                    self.__permitted_subclasses,
+                    self.__javadoc,
+                    self.__annotations,
+                    self.__fields,
+                    self.__methods,
+                    self.__types,
+                    self.__enum_constants,
+                    self.__record_components,
+                )
+
             return TypeSpec(
                 self.__name,
                 self.__kind,
@@ -530,6 +640,10 @@ class TypeSpec(Code["TypeSpec"]):
                 deep_copy(self.__record_components),
             )
 
+        def __check_not_consumed(self) -> None:
+            if self.__consumed:
+                raise ValueError("Builder has already been built with one_shot=True")
+
     class AnonymousClassBuilder(Code.Builder["TypeSpec"]):
         """
         Builder for anonymous inner classes.
@@ -567,3 +681,12 @@ class TypeSpec(Code["TypeSpec"]):
             type_spec.anonymous_class_args = self.constructor_args
             type_spec.superclass = self.type_name
             return type_spec
+
+
+_KIND_KEYWORDS = {
+    TypeSpec.Kind.CLASS: "class",
+    TypeSpec.Kind.INTERFACE: "interface",
+    TypeSpec.Kind.ENUM: "enum",
+    TypeSpec.Kind.ANNOTATION: "@interface",
+    TypeSpec.Kind.RECORD: "record",
+}
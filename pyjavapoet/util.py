@@ -14,17 +14,28 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from functools import lru_cache
 from typing import Any
 
+from pyjavapoet.modifier import Modifier
+
 
 def is_ascii_upper(s: str) -> bool:
     return s.isascii() and s.isupper()
 
 
+# Values that never need copying. Checked by exact type first since they make up
+# most of what deep_copy sees (names, flags, modifiers).
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), Modifier})
+
+
 def deep_copy(obj: Any) -> Any:
-    if isinstance(obj, list):
+    obj_type = type(obj)
+    if obj_type in _ATOMIC_TYPES:
+        return obj
+    elif obj_type is list or isinstance(obj, list):
         return [deep_copy(item) for item in obj]
-    elif isinstance(obj, dict):
+    elif obj_type is dict or isinstance(obj, dict):
         return {key: deep_copy(value) for key, value in obj.items()}
     elif hasattr(obj, "copy"):
         return obj.copy()
@@ -41,61 +52,119 @@ def throw_if_invalid_java_identifier(s: str) -> None:
         raise ValueError(f"String '{s}' is not a valid Java identifier")
 
 
-JAVA_KEYWORDS = {
-    # All Java keywords (including reserved literals)
-    # that cannot be used as identifiers for fields, parameters, or values.
-    "abstract",
-    "assert",
-    "boolean",
-    "break",
-    "byte",
-    "case",
-    "catch",
-    "char",
-    "class",
-    "const",
-    "continue",
-    "default",
-    "do",
-    "double",
-    "else",
-    "enum",
-    "extends",
-    "final",
-    "finally",
-    "float",
-    "for",
-    "goto",
-    "if",
-    "implements",
-    "import",
-    "instanceof",
-    "int",
-    "interface",
-    "long",
-    "native",
-    "new",
-    "package",
-    "private",
-    "protected",
-    "public",
-    "return",
-    "short",
-    "static",
-    "strictfp",
-    "super",
-    "switch",
-    "synchronized",
-    "this",
-    "throw",
-    "throws",
-    "transient",
-    "try",
-    "void",
-    "volatile",
-    "while",
-    # Reserved literals
-    "true",
-    "false",
-    "null",
-}
+def _escape_character(c: str) -> str:
+    """Escape one character as Java does inside a literal, quotes aside."""
+    match c:
+        case "\b":
+            return "\\b"
+        case "\t":
+            return "\\t"
+        case "\n":
+            return "\\n"
+        case "\f":
+            return "\\f"
+        case "\r":
+            return "\\r"
+        case "\\":
+            return "\\\\"
+    # ISO control characters have no short escape
+    if ord(c) <= 0x1F or 0x7F <= ord(c) <= 0x9F:
+        return f"\\u{ord(c):04x}"
+    return c
+
+
+# Escaped form of every character below 256, the only ones that may need escaping.
+# Single quotes are escaped in character literals, double quotes in string literals.
+_CHARACTER_ESCAPES: tuple[str, ...] = tuple("\\'" if i == 0x27 else _escape_character(chr(i)) for i in range(256))
+_STRING_ESCAPES: tuple[str, ...] = tuple('\\"' if i == 0x22 else _escape_character(chr(i)) for i in range(256))
+
+
+# Only a handful of distinct characters are ever quoted, so each one is escaped once
+@lru_cache(maxsize=1024)
+def character_literal(c: str) -> str:
+    """Return c as a quoted Java character literal, i.e. '\\n' for a newline."""
+    if len(c) != 1:
+        raise ValueError(f"Character literal must be a single character, got {c!r}")
+    code_point = ord(c)
+    return "'" + (_CHARACTER_ESCAPES[code_point] if code_point < 256 else c) + "'"
+
+
+# Only the characters that change, for str.translate
+_STRING_TRANSLATION: dict[int, str] = {i: escape for i, escape in enumerate(_STRING_ESCAPES) if escape != chr(i)}
+
+
+def string_literal(s: str) -> str:
+    """Return s as a quoted Java string literal, escaping quotes, backslashes and control characters."""
+    if s.isprintable():
+        # No control characters (the common case), so only backslashes and quotes need escaping.
+        # Two replace calls are much faster than translate for this.
+        return '"' + s.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if s.isascii():
+        return '"' + s.translate(_STRING_TRANSLATION) + '"'
+    # translate probes its table for every non-ASCII character, walking the escape table is cheaper.
+    # A list (not a generator) lets join size its result in one pass.
+    escapes = _STRING_ESCAPES
+    return '"' + "".join([escapes[code_point] if (code_point := ord(c)) < 256 else c for c in s]) + '"'
+
+
+# Frozen so the shared table cannot be changed at runtime; membership is a single hash probe
+JAVA_KEYWORDS = frozenset(
+    {
+        # All Java keywords (including reserved literals)
+        # that cannot be used as identifiers for fields, parameters, or values.
+        "abstract",
+        "assert",
+        "boolean",
+        "break",
+        "byte",
+        "case",
+        "catch",
+        "char",
+        "class",
+        "const",
+        "continue",
+        "default",
+        "do",
+        "double",
+        "else",
+        "enum",
+        "extends",
+        "final",
+        "finally",
+        "float",
+        "for",
+        "goto",
+        "if",
+        "implements",
+        "import",
+        "instanceof",
+        "int",
+        "interface",
+        "long",
+        "native",
+        "new",
+        "package",
+        "private",
+        "protected",
+        "public",
+        "return",
+        "short",
+        "static",
+        "strictfp",
+        "super",
+        "switch",
+        "synchronized",
+        "this",
+        "throw",
+        "throws",
+        "transient",
+        "try",
+        "void",
+        "volatile",
+        "while",
+        # Reserved literals
+        "true",
+        "false",
+        "null",
+    }
+)
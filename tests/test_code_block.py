@@ -104,6 +104,9 @@ class CodeBlockTest(unittest.TestCase):
         block = CodeBlock.of("$S", "hello\\world")
         self.assertEqual(str(block), '"hello\\\\world"')
 
+        block = CodeBlock.of("$S", "line\n\ttabbed")
+        self.assertEqual(str(block), '"line\\n\\ttabbed"')
+
     def test_indent_and_unindent(self):
         """Test indent and unindent placeholders."""
         block = CodeBlock.builder().add("start\n$>indented\n$<end").build()
@@ -210,11 +213,61 @@ class CodeBlockTest(unittest.TestCase):
         block = CodeBlock.builder().build()
         self.assertEqual(str(block), "")
 
+    def test_str_is_cached(self):
+        """Test a block renders once and returns the same string afterwards."""
+        block = CodeBlock.of("$T x = $S;", ClassName.get("java.lang", "String"), "x")
+        self.assertEqual(str(block), 'String x = "x";')
+        self.assertIs(str(block), str(block))
+
+    def test_is_empty(self):
+        """Test is_empty on builders and built blocks."""
+        self.assertTrue(CodeBlock.builder().is_empty())
+        self.assertTrue(CodeBlock.builder().add("").is_empty())
+        self.assertFalse(CodeBlock.builder().add(" ").is_empty())
+        self.assertTrue(CodeBlock.builder().build().is_empty())
+        self.assertFalse(CodeBlock.of("$L", "x").is_empty())
+        self.assertFalse(CodeBlock.of("x").to_builder().is_empty())
+
     def test_no_placeholders(self):
         """Test code block with no placeholders."""
         block = CodeBlock.of("just text")
         self.assertEqual(str(block), "just text")
 
+    def test_repeated_format_string(self):
+        """Test a reused format string binds fresh arguments each time."""
+        first = CodeBlock.of("$N = $S", "name", "taco")
+        second = CodeBlock.of("$N = $S", "size", "large")
+        self.assertEqual(str(first), 'name = "taco"')
+        self.assertEqual(str(second), 'size = "large"')
+
+    def test_of_interns_literal_blocks(self):
+        """Test blocks built only from literal arguments are shared."""
+        self.assertIs(CodeBlock.of("$S", "hello"), CodeBlock.of("$S", "hello"))
+        self.assertIsNot(CodeBlock.of("$L", True), CodeBlock.of("$L", 1))
+        self.assertEqual(str(CodeBlock.of("$L", True)), "true")
+        self.assertEqual(str(CodeBlock.of("$L", 1)), "1")
+
+    def test_interned_blocks_cannot_be_changed(self):
+        """Test shared blocks have immutable containers, and to_builder still gives a usable builder."""
+        block = CodeBlock.of("x $L", 1)
+        with self.assertRaises(AttributeError):
+            block.format_parts.append("y")
+        with self.assertRaises(AttributeError):
+            block.args.append(2)
+        with self.assertRaises(TypeError):
+            block.named_args["y"] = 2
+        self.assertEqual(str(CodeBlock.of("x $L", 1)), "x 1")
+
+        self.assertEqual(str(block.to_builder().add(" + $L", 2).build()), "x 1 + 2")
+        self.assertEqual(str(block), "x 1")
+
+    def test_of_does_not_intern_long_strings(self):
+        """Test long format strings and arguments are not kept alive by the intern cache."""
+        long_text = "x" * 1000
+        self.assertIsNot(CodeBlock.of("$S", long_text), CodeBlock.of("$S", long_text))
+        self.assertIsNot(CodeBlock.of(long_text), CodeBlock.of(long_text))
+        self.assertEqual(str(CodeBlock.of("$L", long_text)), long_text)
+
     def test_regex_compilation(self):
         """Test that the regex pattern compiles without errors."""
         # This should not raise an exception
@@ -17,7 +17,9 @@ limitations under the License.
 import unittest
 
 from pyjavapoet.code_writer import CodeWriter
+from pyjavapoet.method_spec import MethodSpec
 from pyjavapoet.type_name import ClassName
+from pyjavapoet.type_spec import TypeSpec
 
 
 class CodeWriterTest(unittest.TestCase):
@@ -73,6 +75,22 @@ class CodeWriterTest(unittest.TestCase):
         expected = "// line1\n// \n// \n// line2\n// line3"
         self.assertEqual(result, expected)
 
+    def test_emit_leading_double_newline_in_indented_block(self):
+        """Test that text starting with a blank line indents its second line, as it always has."""
+        writer = CodeWriter()
+        writer.indent(2)
+        writer.emit("int b;\n")
+        writer.emit("\n\nx;\n")
+
+        self.assertEqual(str(writer), "    int b;\n\n    \n    x;\n")
+
+    def test_method_raw_code_with_leading_double_newline(self):
+        """Test the leading blank line indentation through the public MethodSpec API."""
+        method = MethodSpec.method_builder("f").add_statement("int b").add_raw_code("$L", "\n\nx;\n").build()
+        type_spec = TypeSpec.class_builder("A").add_method(method).build()
+
+        self.assertEqual(str(type_spec), "class A {\n  void f() {\n    int b;\n\n    \n    x;\n  }\n}")
+
     def test_custom_indent_string(self):
         """Test custom indentation string."""
         writer = CodeWriter(indent="\t")
@@ -170,6 +170,13 @@ String name;
         result = str(field)
         self.assertEqual("@Nullable\n@Deprecated\nString name;\n", result)
 
+        bulk_field = (
+            FieldSpec.builder(ClassName.get("java.lang", "String"), "name")
+            .add_annotations(nullable, deprecated)
+            .build()
+        )
+        self.assertEqual(str(bulk_field), result)
+
     def test_invalid_field_name(self):
         """Test that invalid field names are rejected."""
         with self.assertRaises(ValueError):
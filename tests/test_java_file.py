@@ -14,8 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import re
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from io import StringIO
 from pathlib import Path
 
@@ -28,6 +31,9 @@ from pyjavapoet.parameter_spec import ParameterSpec
 from pyjavapoet.type_name import ClassName, TypeVariableName
 from pyjavapoet.type_spec import TypeSpec
 
+# TypeSpecs are immutable once built, so tests that just need an empty class can share one
+EMPTY_TEST_CLASS = TypeSpec.class_builder("Test").build()
+
 
 class JavaFileTest(unittest.TestCase):
     """Test the JavaFile class."""
@@ -76,7 +82,7 @@ class JavaFileTest(unittest.TestCase):
 
     def test_no_imports(self):
         """Test file with no imports."""
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         java_file = JavaFile.builder("com.example", type_spec).build()
 
         result = str(java_file)
@@ -111,9 +117,8 @@ class JavaFileTest(unittest.TestCase):
 
         java_file = JavaFile.builder("com.example", type_spec).build()
 
-        result = str(java_file)
         # One should be imported, the other should be fully qualified
-        import_count = result.count("import java.awt.List;") + result.count("import java.util.List;")
+        import_count = sum(1 for name in java_file.imports() if name.endswith(".List"))
         self.assertEqual(import_count, 1)
 
     def test_skip_java_lang_imports_with_conflicting_class_names(self):
@@ -185,7 +190,7 @@ class JavaFileTest(unittest.TestCase):
 
     def test_file_comment(self):
         """Test file header comment."""
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         java_file = (
             JavaFile.builder("com.example", type_spec)
             .add_file_comment_line("This is a generated file.")
@@ -197,6 +202,17 @@ class JavaFileTest(unittest.TestCase):
         self.assertIn(" * This is a generated file.", result)
         self.assertIn(" * Do not modify directly.", result)
 
+    def test_file_comment_lines_are_joined_once(self):
+        """Test many file comment lines build one flat CodeBlock."""
+        builder = JavaFile.builder("com.example", EMPTY_TEST_CLASS)
+        for i in range(100):
+            builder.add_file_comment_line("Line $L", i)
+        java_file = builder.build()
+
+        self.assertEqual(len(java_file.file_comment.args), 100)
+        self.assertIn(" * Line 0\n * Line 1\n", str(java_file))
+        self.assertIn(" * Line 99\n */\n", str(java_file))
+
     def test_skip_java_lang_imports(self):
         """Test that java.lang imports are automatically skipped."""
         type_spec = (
@@ -208,9 +224,8 @@ class JavaFileTest(unittest.TestCase):
 
         java_file = JavaFile.builder("com.example", type_spec).build()
 
+        self.assertEqual(java_file.imports(), [])
         result = str(java_file)
-        self.assertNotIn("import java.lang.String;", result)
-        self.assertNotIn("import java.lang.Object;", result)
         self.assertIn("String name", result)
         self.assertIn("Object obj", result)
 
@@ -295,23 +310,51 @@ class JavaFileTest(unittest.TestCase):
 
         result = str(java_file)
         # Should use tabs for indentation
-        lines = result.split("\n")
-        method_line = next((line for line in lines if "public void test()" in line), None)
-        assert method_line
-        self.assertTrue(method_line.startswith("\t"))
+        method_line = re.search(r"^(\s*)public void test\(\)", result, re.MULTILINE)
+        self.assertIsNotNone(method_line)
+        self.assertEqual(method_line.group(1), "\t")
+
+    def test_contains(self):
+        """Test checking the rendered file for a snippet."""
+        java_file = (
+            JavaFile.builder("com.example", EMPTY_TEST_CLASS)
+            .add_static_import(ClassName.get("java.lang", "System"), "out")
+            .build()
+        )
+
+        self.assertIn("import static java.lang.System.out;", java_file)
+        self.assertIn("class Test {", java_file)
+        self.assertNotIn("import java.util.List;", java_file)
 
     def test_java_file_equals_and_hash_code(self):
         """Test JavaFile equals and hash code."""
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         a = JavaFile.builder("com.example", type_spec).build()
         b = JavaFile.builder("com.example", type_spec).build()
 
         self.assertEqual(a, b)
         self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, JavaFile.builder("com.other", type_spec).build())
+        self.assertNotEqual(a, str(a))
+
+    def test_shared_type_spec_is_not_modified(self):
+        """Test files built from the shared empty class leave it untouched."""
+        before = str(EMPTY_TEST_CLASS)
+        java_file = (
+            JavaFile.builder("com.example", EMPTY_TEST_CLASS)
+            .add_static_import(ClassName.get("java.lang", "System"), "out")
+            .build()
+        )
+        str(java_file.to_builder().add_additional_import("java.util.List").build())
+
+        self.assertIs(java_file.type_spec, EMPTY_TEST_CLASS)
+        self.assertEqual(str(EMPTY_TEST_CLASS), before)
+        self.assertEqual(EMPTY_TEST_CLASS.fields, [])
+        self.assertEqual(EMPTY_TEST_CLASS.methods, [])
 
     def test_java_file_to_builder(self):
         """Test JavaFile to builder conversion."""
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         original = JavaFile.builder("com.example", type_spec).build()
 
         modified = original.to_builder().add_static_import(ClassName.get("java.lang", "System"), "out").build()
@@ -322,9 +365,60 @@ class JavaFileTest(unittest.TestCase):
         self.assertNotIn("import static", original_str)
         self.assertIn("import static java.lang.System.out;", modified_str)
 
+    def test_to_builder_does_not_change_original(self):
+        """Test imports added through to_builder do not leak into the original file."""
+        type_spec = EMPTY_TEST_CLASS
+        original = (
+            JavaFile.builder("com.example", type_spec)
+            .add_static_import(ClassName.get("java.lang", "Math"), "max")
+            .add_additional_import("java.util.List")
+            .build()
+        )
+        original_str = str(original)
+
+        builder = original.to_builder()
+        builder.add_static_import(ClassName.get("java.lang", "Math"), "min")
+        builder.add_additional_import("java.util.Map")
+        builder.build()
+
+        self.assertEqual(original.static_imports, {ClassName.get("java.lang", "Math"): {"max"}})
+        self.assertEqual(original.additional_imports, {"java.util.List"})
+        self.assertIs(str(original), original_str)
+
+    def test_builder_reuse_does_not_change_built_file(self):
+        """Test imports added to a builder after build() do not leak into the built file."""
+        builder = JavaFile.builder("com.example", EMPTY_TEST_CLASS).add_static_import(
+            ClassName.get("java.lang", "Math"), "max"
+        )
+        built = builder.build()
+
+        builder.add_static_import(ClassName.get("java.lang", "Math"), "min")
+        builder.add_additional_import("java.util.Map")
+
+        self.assertEqual(built.static_imports, {ClassName.get("java.lang", "Math"): {"max"}})
+        self.assertEqual(built.additional_imports, set())
+
+    def test_import_collections_are_frozen(self):
+        """Test a built file's imports cannot be changed under its cached rendering."""
+        java_file = (
+            JavaFile.builder("com.example", EMPTY_TEST_CLASS)
+            .add_static_import(ClassName.get("java.lang", "Math"), "max")
+            .add_additional_import("java.util.List")
+            .build()
+        )
+        rendered = str(java_file)
+
+        with self.assertRaises(TypeError):
+            java_file.static_imports[ClassName.get("java.lang", "Math")] = {"min"}
+        with self.assertRaises(AttributeError):
+            java_file.static_imports[ClassName.get("java.lang", "Math")].add("min")
+        with self.assertRaises(AttributeError):
+            java_file.additional_imports.add("java.util.Map")
+        self.assertEqual(str(java_file.to_builder().build()), rendered)
+
     def test_write_to_string_io(self):
         """Test writing to StringIO."""
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         java_file = JavaFile.builder("com.example", type_spec).build()
 
         output = StringIO()
@@ -540,16 +634,63 @@ public class Top {
         self.assertNotIn("import java.util.List;", result)
         # Should still contain the class and use the simple name
         self.assertIn("List<String> items", result)
+        self.assertEqual(java_file.imports(), ["java.util.*"])
+
+
+class JavaFilePathTest(unittest.TestCase):
+    """Test file path calculation, which never touches the filesystem."""
+
+    def test_java_file_object_uri(self):
+        """Test JavaFileObject URI generation."""
+        # In Java, this tests javax.tools.JavaFileObject
+        # In Python, we'll test file path/URI generation
+
+        # Different package structures should generate different URIs/paths
+        test_cases = [
+            ("", "Test", Path("Test.java")),
+            ("com.example", "Test", Path("com", "example", "Test.java")),
+            ("deeply.nested.package", "Test", Path("deeply", "nested", "package", "Test.java")),
+        ]
+
+        for package, class_name, expected_relative_path in test_cases:
+            with self.subTest(package=package, class_name=class_name):
+                type_spec = TypeSpec.class_builder(class_name).build()
+                java_file = JavaFile.builder(package, type_spec).build()
+
+                relative_path = java_file.get_relative_path()
+                self.assertEqual(relative_path, expected_relative_path)
+
+    def test_relative_path_calculation(self):
+        """Test relative path calculation for different package structures."""
+        test_cases: list[tuple[str, str, Path]] = [
+            ("", "Test", Path("Test.java")),
+            ("com", "Test", Path("com", "Test.java")),
+            ("com.example", "Test", Path("com", "example", "Test.java")),
+            (
+                "org.springframework.boot",
+                "Application",
+                Path("org", "springframework", "boot", "Application.java"),
+            ),
+        ]
+
+        for package, class_name, expected_path in test_cases:
+            with self.subTest(package=package, class_name=class_name):
+                type_spec = TypeSpec.class_builder(class_name).build()
+                java_file = JavaFile.builder(package, type_spec).build()
+
+                relative_path = java_file.get_relative_path()
+                self.assertEqual(relative_path, expected_path)
 
 
 class JavaFileReadWriteTest(unittest.TestCase):
     """Test file reading functionality."""
 
-    def setUp(self):
-        """Set up test with a sample Java file."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample Java file once; the specs are immutable so every test can share it."""
+        cls.root_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.root_dir.cleanup)
 
-        # Create a sample Java file
         method = (
             MethodSpec.method_builder("main")
             .add_modifiers(Modifier.PUBLIC, Modifier.STATIC)
@@ -566,41 +707,26 @@ class JavaFileReadWriteTest(unittest.TestCase):
             .build()
         )
 
-        self.java_file = JavaFile.builder("com.example", type_spec).build()
-        self.file_path = self.java_file.write_to_dir(self.temp_dir)
+        cls.java_file = JavaFile.builder("com.example", type_spec).build()
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        import shutil
+    @cached_property
+    def temp_dir(self) -> Path:
+        """A directory of this test's own under the shared root, created on first use."""
+        return Path(tempfile.mkdtemp(dir=self.root_dir.name))
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_java_file_object_uri(self):
-        """Test JavaFileObject URI generation."""
-        # In Java, this tests javax.tools.JavaFileObject
-        # In Python, we'll test file path/URI generation
-
-        # Different package structures should generate different URIs/paths
-        test_cases = [
-            ("", "Test", Path("Test.java")),
-            ("com.example", "Test", Path("com", "example", "Test.java")),
-            ("deeply.nested.package", "Test", Path("deeply", "nested", "package", "Test.java")),
-        ]
-
-        for package, class_name, expected_relative_path in test_cases:
-            type_spec = TypeSpec.class_builder(class_name).build()
-            java_file = JavaFile.builder(package, type_spec).build()
-
-            relative_path = java_file.get_relative_path()
-            self.assertEqual(relative_path, expected_relative_path)
+    def write_and_read(self, java_file: JavaFile) -> str:
+        """Write the file to disk, check it matches the (cached) rendering and return its content."""
+        content = java_file.write_to_dir(self.temp_dir).read_text(encoding="utf-8")
+        self.assertEqual(content, str(java_file))
+        return content
 
     def test_java_file_object_kind(self):
         """Test JavaFileObject kind detection."""
         # Test that we can identify Java source files
-        self.assertTrue(self.file_path.suffix == ".java")
+        self.assertTrue(self.java_file.get_relative_path().suffix == ".java")
 
         # Test file extension handling
-        type_spec = TypeSpec.class_builder("Test").build()
+        type_spec = EMPTY_TEST_CLASS
         java_file = JavaFile.builder("com.example", type_spec).build()
 
         relative_path = java_file.get_relative_path()
@@ -608,15 +734,17 @@ class JavaFileReadWriteTest(unittest.TestCase):
 
     def test_java_file_object_character_content(self):
         """Test reading character content."""
-        # Read the file we created
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Render in memory; the disk round trip is covered by the write_and_read tests
+        output = StringIO()
+        self.java_file.write_to(output)
+        content = output.getvalue()
 
-        # Should contain expected elements
-        self.assertIn("package com.example;", content)
-        self.assertIn("public final class HelloWorld", content)
-        self.assertIn("public static void main(String[] args)", content)
-        self.assertIn('System.out.println("Hello, World!");', content)
+        # Should contain expected elements, in order
+        self.assertRegex(
+            content,
+            r"(?s)package com\.example;.*public final class HelloWorld.*"
+            r"public static void main\(String\[\] args\).*System\.out\.println\(\"Hello, World!\"\);",
+        )
 
     def test_java_file_object_input_stream_is_utf8(self):
         """Test that file input stream uses UTF-8 encoding."""
@@ -635,32 +763,27 @@ class JavaFileReadWriteTest(unittest.TestCase):
         unicode_file_path = java_file.write_to_dir(self.temp_dir)
 
         # Read as bytes and decode as UTF-8
-        with open(unicode_file_path, "rb") as f:
-            byte_content = f.read()
-
+        byte_content = unicode_file_path.read_bytes()
         decoded_content = byte_content.decode("utf-8")
         self.assertIn("Unicode: 世界 🌍", decoded_content)
 
     def test_file_content_consistency(self):
         """Test that file content matches the JavaFile string representation."""
-        # Read the written file
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            file_content = f.read()
+        # Write to a buffer; disk content is checked against str() by every write_and_read test
+        output = StringIO()
+        self.java_file.write_to(output)
 
         # Compare with JavaFile's string representation
-        java_file_str = str(self.java_file)
-
-        self.assertEqual(file_content.strip(), java_file_str.strip())
+        self.assertEqual(output.getvalue(), str(self.java_file))
 
     def test_read_written_file_roundtrip(self):
         """Test reading a file that was written by JavaFile."""
         # Create a complex Java file
+        list_of_string = ClassName.LIST.with_type_arguments(ClassName.STRING)
         field = (
-            FieldSpec.builder(
-                ClassName.get("java.util", "List").with_type_arguments(ClassName.get("java.lang", "String")), "items"
-            )
+            FieldSpec.builder(list_of_string, "items")
             .add_modifiers(Modifier.PRIVATE, Modifier.FINAL)
-            .initializer("new $T<>()", ClassName.get("java.util", "ArrayList"))
+            .initializer("new $T<>()", ClassName.ARRAY_LIST)
             .build()
         )
 
@@ -668,7 +791,7 @@ class JavaFileReadWriteTest(unittest.TestCase):
             MethodSpec.method_builder("addItem")
             .add_modifiers(Modifier.PUBLIC)
             .returns("void")
-            .add_parameter(ClassName.get("java.lang", "String"), "item")
+            .add_parameter(ClassName.STRING, "item")
             .add_statement("items.add(item)")
             .build()
         )
@@ -676,8 +799,8 @@ class JavaFileReadWriteTest(unittest.TestCase):
         method2 = (
             MethodSpec.method_builder("getItems")
             .add_modifiers(Modifier.PUBLIC)
-            .returns(ClassName.get("java.util", "List").with_type_arguments(ClassName.get("java.lang", "String")))
-            .add_statement("return new $T<>(items)", ClassName.get("java.util", "ArrayList"))
+            .returns(list_of_string)
+            .add_statement("return new $T<>(items)", ClassName.ARRAY_LIST)
             .build()
         )
 
@@ -691,11 +814,9 @@ class JavaFileReadWriteTest(unittest.TestCase):
         )
 
         java_file = JavaFile.builder("com.example.container", type_spec).build()
-        file_path = java_file.write_to_dir(self.temp_dir)
 
         # Read back and verify structure
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self.write_and_read(java_file)
 
         # Verify package
         self.assertIn("package com.example.container;", content)
@@ -715,11 +836,9 @@ class JavaFileReadWriteTest(unittest.TestCase):
         # Create minimal class
         type_spec = TypeSpec.class_builder("Empty").build()
         java_file = JavaFile.builder("com.example", type_spec).build()
-        file_path = java_file.write_to_dir(self.temp_dir)
 
         # Read and verify
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self.write_and_read(java_file)
 
         self.assertIn("package com.example;", content)
         self.assertIn("class Empty {", content)
@@ -756,11 +875,8 @@ class JavaFileReadWriteTest(unittest.TestCase):
             .build()
         )
 
-        file_path = java_file.write_to_dir(self.temp_dir)
-
         # Read and verify comments are preserved
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self.write_and_read(java_file)
 
         expected = """\
 /**
@@ -789,17 +905,45 @@ class Commented {
 """
         self.assertEqual(content, expected)
 
+    def test_write_many_files_concurrently(self):
+        """Test independent files can be rendered and written from several threads at once."""
+        cases = [
+            ("", "Default"),
+            ("com", "Shallow"),
+            ("com.example", "Test"),
+            ("com.example.nested", "Test"),
+            ("deeply.nested.package.structure", "Deep"),
+        ]
+
+        temp_dir = self.temp_dir
+        field = FieldSpec.builder(ClassName.LIST, "items").build()
+
+        def write(case: tuple[str, str]) -> Path:
+            package, class_name = case
+            type_spec = TypeSpec.class_builder(class_name).add_field(field).build()
+            return JavaFile.builder(package, type_spec).build().write_to_dir(temp_dir)
+
+        with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+            paths = list(executor.map(write, cases))
+
+        for (package, class_name), path in zip(cases, paths):
+            with self.subTest(package=package, class_name=class_name):
+                self.assertEqual(path, Path(temp_dir, *package.split("."), f"{class_name}.java"))
+                content = path.read_text(encoding="utf-8")
+                self.assertIn(f"class {class_name} {{", content)
+                self.assertIn("import java.util.List;", content)
+
     def test_large_file_handling(self):
         """Test handling of larger files."""
         # Create a class with many methods
         type_spec_builder = TypeSpec.class_builder("LargeClass").add_modifiers(Modifier.PUBLIC)
 
-        # Add many methods
+        # Add many methods, all stamped out from one prototype
+        prototype = MethodSpec.method_builder("prototype").add_modifiers(Modifier.PUBLIC).returns("void")
         for i in range(50):
             method = (
-                MethodSpec.method_builder(f"method{i}")
-                .add_modifiers(Modifier.PUBLIC)
-                .returns("void")
+                prototype.copy()
+                .set_name(f"method{i}")
                 .add_parameter("int", f"param{i}")
                 .add_statement("System.out.println($S + param$L)", f"Method {i}: ", i)
                 .build()
@@ -808,36 +952,15 @@ class Commented {
 
         type_spec = type_spec_builder.build()
         java_file = JavaFile.builder("com.example.large", type_spec).build()
-        file_path = java_file.write_to_dir(self.temp_dir)
 
         # Read and verify
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Should contain all methods
-        for i in range(50):
-            self.assertIn(f"public void method{i}(int param{i})", content)
-            self.assertIn(f'"Method {i}: "', content)
-
-    def test_relative_path_calculation(self):
-        """Test relative path calculation for different package structures."""
-        test_cases: list[tuple[str, str, Path]] = [
-            ("", "Test", Path("Test.java")),
-            ("com", "Test", Path("com", "Test.java")),
-            ("com.example", "Test", Path("com", "example", "Test.java")),
-            (
-                "org.springframework.boot",
-                "Application",
-                Path("org", "springframework", "boot", "Application.java"),
-            ),
-        ]
-
-        for package, class_name, expected_path in test_cases:
-            type_spec = TypeSpec.class_builder(class_name).build()
-            java_file = JavaFile.builder(package, type_spec).build()
+        content = self.write_and_read(java_file)
 
-            relative_path = java_file.get_relative_path()
-            self.assertEqual(relative_path, expected_path)
+        # Should contain all methods, each with its own parameter and message
+        methods = re.findall(r"public void method(\d+)\(int param(\d+)\)", content)
+        self.assertEqual(sorted(int(method) for method, param in methods if method == param), list(range(50)))
+        messages = re.findall(r'"Method (\d+): "', content)
+        self.assertEqual(sorted(map(int, messages)), list(range(50)))
 
 
 if __name__ == "__main__":
@@ -99,6 +99,47 @@ class MethodSpecTest(unittest.TestCase):
         result = str(constructor.to_builder().set_name("ClassName").build())
         self.assertIn("public ClassName(String name)", result)
 
+    def test_builder_copy(self):
+        """Test copied builders can be changed independently."""
+        prototype = MethodSpec.method_builder("proto").add_modifiers(Modifier.PUBLIC).returns("void")
+        prototype.add_statement("int x = 1")
+
+        first = prototype.copy().set_name("first").add_parameter("int", "a").add_statement("x = a").build()
+        second = prototype.copy().set_name("second").add_modifiers(Modifier.STATIC).build()
+        original = prototype.build()
+
+        self.assertEqual("public void first(int a) {\n  int x = 1;\n  x = a;\n}\n", str(first))
+        self.assertEqual("public static void second() {\n  int x = 1;\n}\n", str(second))
+        self.assertEqual("public void proto() {\n  int x = 1;\n}\n", str(original))
+
+    def test_builder_copy_keeps_open_statement_chain(self):
+        """Test a builder copied mid-chain can finish the chain on its own."""
+        prototype = MethodSpec.method_builder("proto").begin_statement_chain("System")
+        prototype.add_chained_item(".out")
+
+        copied = prototype.copy().add_chained_item(".println($S)", "hi").end_statement_chain().build()
+
+        self.assertEqual('void proto() {\n  System\n      .out\n      .println("hi");\n}\n', str(copied))
+        with self.assertRaises(ValueError):
+            prototype.build()
+
+    def test_with_name(self):
+        """Test renaming a method without rebuilding it."""
+        constructor = (
+            MethodSpec.constructor_builder()
+            .add_modifiers(Modifier.PUBLIC)
+            .add_parameter(ClassName.get("java.lang", "String"), "name")
+            .add_statement("this.name = name")
+            .build()
+        )
+
+        renamed = constructor.with_name("Taco")
+        self.assertEqual("Taco", renamed.name)
+        self.assertEqual("<init>", constructor.name)
+        self.assertIs(constructor.parameters, renamed.parameters)
+        self.assertIs(constructor.code, renamed.code)
+        self.assertIn("public Taco(String name)", str(renamed))
+
     def test_abstract_method(self):
         """Test abstract method creation."""
         method = (
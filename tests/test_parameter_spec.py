@@ -30,6 +30,8 @@ class ParameterSpecTest(unittest.TestCase):
         b = ParameterSpec.builder(ClassName.get("java.lang", "String"), "name").build()
         self.assertEqual(a, b)
         self.assertEqual(hash(a), hash(b))
+        self.assertEqual(a, a)
+        self.assertNotEqual(a, ParameterSpec.builder(ClassName.get("java.lang", "String"), "other").build())
 
     def test_basic_parameter_creation(self):
         """Test basic parameter creation."""
@@ -70,6 +72,15 @@ class ParameterSpecTest(unittest.TestCase):
         self.assertIn("@Nullable", result)
         self.assertIn("@Nonnull", result)
 
+    def test_add_annotations(self):
+        """Test adding several annotations at once."""
+        nullable = AnnotationSpec.builder(ClassName.get("javax.annotation", "Nullable")).build()
+        nonnull = AnnotationSpec.builder(ClassName.get("javax.annotation", "Nonnull")).build()
+        builder = ParameterSpec.builder(ClassName.get("java.lang", "String"), "value")
+
+        param = builder.add_annotations(nullable, nonnull).build()
+        self.assertEqual(str(param), "@Nullable @Nonnull String value")
+
     def test_primitive_parameter(self):
         """Test primitive parameter."""
         param = ParameterSpec.builder("int", "count").build()
@@ -186,6 +197,18 @@ class ParameterSpecTest(unittest.TestCase):
 
         self.assertEqual(str(param), str(new_param))
 
+    def test_to_builder_does_not_change_original(self):
+        """Test adding to a builder made from a parameter leaves the parameter unchanged."""
+        param = (
+            ParameterSpec.builder(ClassName.get("java.lang", "String"), "name")
+            .add_annotation(AnnotationSpec.get(ClassName.get("", "Nullable")))
+            .build()
+        )
+
+        param.to_builder().add_final().add_annotation(AnnotationSpec.get(ClassName.get("", "NotBlank"))).build()
+
+        self.assertEqual(str(param), "@Nullable String name")
+
     def test_wildcard_type_parameter(self):
         """Test parameter with wildcard type."""
         wildcard_list = ClassName.get("java.util", "List").with_type_arguments("? extends Number")
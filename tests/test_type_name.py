@@ -16,6 +16,7 @@ limitations under the License.
 
 import unittest
 
+from pyjavapoet.annotation_spec import AnnotationSpec
 from pyjavapoet.type_name import (
     ArrayTypeName,
     ClassName,
@@ -115,6 +116,29 @@ class TypeNameTest(unittest.TestCase):
         self.assertEqual(TypeName.get(tuple), ClassName.LIST)
         self.assertEqual(TypeName.get(None), ClassName.VOID)
 
+    def test_get_returns_shared_instances(self):
+        """Test primitives and mapped Python types resolve to the shared constants."""
+        self.assertIs(TypeName.get("int"), ClassName.INTEGER)
+        self.assertIs(TypeName.get("boolean"), ClassName.BOOLEAN)
+        self.assertIs(TypeName.get("void"), ClassName.VOID)
+        self.assertIs(TypeName.get(int), ClassName.INTEGER)
+        self.assertIs(TypeName.get(object), ClassName.OBJECT)
+        self.assertTrue(TypeName.get("int[]").is_primitive())
+
+    def test_str_is_cached(self):
+        """Test composite types render once and keep their string form."""
+        list_of_string = ClassName.get("java.util", "List").with_type_arguments(ClassName.get("java.lang", "String"))
+        self.assertEqual(str(list_of_string), "List<String>")
+        self.assertIs(str(list_of_string), str(list_of_string))
+        other_list_of_string = ClassName.get("java.util", "List").with_type_arguments("java.lang.String")
+        self.assertEqual(hash(list_of_string), hash(other_list_of_string))
+        self.assertEqual(hash(list_of_string), hash(list_of_string))
+
+        string_array = ClassName.get("java.lang", "String").array()
+        self.assertEqual(str(string_array), "String[]")
+        annotated = string_array.annotated(AnnotationSpec.get(ClassName.get("", "Nullable")))
+        self.assertNotEqual(str(annotated), str(string_array))
+
     def test_is_primitive(self):
         """Test primitive type detection."""
         self.assertTrue(TypeName.get("boolean").is_primitive())
@@ -130,6 +154,18 @@ class TypeNameTest(unittest.TestCase):
         self.assertFalse(ClassName.get("java.lang", "String").is_primitive())
         self.assertFalse(ClassName.get("java.lang", "Object").is_primitive())
 
+    def test_parameterized_type_name_is_interned(self):
+        """Test plain parameterized types are shared, annotated ones are not."""
+        list_of_string = ClassName.get("java.util", "List").with_type_arguments("java.lang.String")
+        self.assertIs(list_of_string, ParameterizedTypeName.get("java.util.List", ClassName.STRING))
+        self.assertIsNot(list_of_string, ClassName.get("java.util", "List").with_type_arguments(ClassName.OBJECT))
+
+        nullable = AnnotationSpec.get(ClassName.get("", "Nullable"))
+        annotated_string = ClassName.STRING.annotated(nullable)
+        annotated_list = ClassName.get("java.util", "List").with_type_arguments(annotated_string)
+        self.assertIsNot(annotated_list, list_of_string)
+        self.assertEqual(str(annotated_list), "List<@Nullable String>")
+
     def test_is_boxed_primitive(self):
         """Test boxed primitive detection."""
         self.assertTrue(ClassName.get("java.lang", "Boolean").is_boxed_primitive())
@@ -257,6 +293,11 @@ class ClassNameTest(unittest.TestCase):
         """Test best guess for simple class names."""
         self.assertEqual(ClassName.get_from_fqcn("String"), ClassName.get("java.lang", "String"))
 
+    def test_best_guess_returns_shared_instance(self):
+        """Test repeated lookups of one name return the same ClassName."""
+        self.assertIs(ClassName.get_from_fqcn("java.util.List"), ClassName.get_from_fqcn("java.util.List"))
+        self.assertIs(ClassName.get_from_fqcn("java.lang.Integer"), ClassName.get("java.lang", "Integer"))
+
     def test_best_guess_non_ascii(self):
         """Test best guess with non-ASCII characters."""
         class_name = ClassName.get_from_fqcn("com.𝕯android.𝕸ctivⅈty")
@@ -324,6 +365,10 @@ class ClassNameTest(unittest.TestCase):
         entry_class = ClassName.get("java.util", "Map", "Entry")
         self.assertEqual(entry_class.simple_name, "Entry")
         self.assertEqual(entry_class.enclosing_class_name, ClassName.get("java.util", "Map"))
+        self.assertIs(entry_class.enclosing_class_name, ClassName.get("java.util", "Map"))
+
+        inner_class = ClassName("", ["String", "Inner"])
+        self.assertEqual(inner_class.enclosing_class_name.canonical_name, "String")
 
     def test_package_name(self):
         """Test package name extraction."""
@@ -340,6 +385,14 @@ class ClassNameTest(unittest.TestCase):
             ClassName.get("java.lang", "Object").top_level_class_name, ClassName.get("java.lang", "Object")
         )
 
+    def test_top_level_class_name_is_shared(self):
+        """Test top level class names are computed once and interned."""
+        entry_class = ClassName.get("java.util", "Map", "Entry")
+        self.assertIs(entry_class.top_level_class_name, entry_class.top_level_class_name)
+        self.assertIs(entry_class.top_level_class_name, ClassName.get("java.util", "Map"))
+        object_class = ClassName.get("java.lang", "Object")
+        self.assertIs(object_class.top_level_class_name, object_class)
+
     def test_equals_and_hash_code(self):
         """Test equals and hash code."""
         a = ClassName.get("java.lang", "String")
@@ -351,6 +404,13 @@ class ClassNameTest(unittest.TestCase):
         self.assertNotEqual(a, c)
         self.assertNotEqual(hash(a), hash(c))
 
+    def test_get_is_interned(self):
+        """Test repeated lookups return the same instance."""
+        self.assertIs(ClassName.get("java.util", "Map", "Entry"), ClassName.get("java.util", "Map", "Entry"))
+        self.assertIs(ClassName.get("java.lang", "String"), ClassName.STRING)
+        self.assertIsNot(ClassName.get("java.util", "Map", "Entry"), ClassName.get("java.util", "Map.Entry"))
+        self.assertEqual(ClassName.get("java.util", "Map", "Entry"), ClassName.get("java.util", "Map.Entry"))
+
     def test_string_representation(self):
         """Test string representation."""
         self.assertEqual(str(ClassName.get("java.lang", "String")), "java.lang.String")
@@ -366,6 +426,9 @@ class ClassNameTest(unittest.TestCase):
         )
         self.assertEqual(ClassName.get("java.lang", "Double").to_type_param(), ClassName.get("java.lang", "Double"))
         self.assertEqual(ClassName.get("java.lang", "Float").to_type_param(), ClassName.get("java.lang", "Float"))
+        self.assertIs(TypeName.get("int").to_type_param(), ClassName.get("java.lang", "Integer"))
+        int_array = TypeName.get("int[]")
+        self.assertIs(int_array.to_type_param(), int_array)
 
     def test_simple_names(self):
         """Test simple names list."""
@@ -423,6 +423,51 @@ public interface Drawable {
         self.assertIn("int x", result)
         self.assertIn("int y", result)
 
+    def test_invalid_modifiers_checked_on_build(self):
+        """Test conflicting class modifiers are rejected when the type is built."""
+        builder = TypeSpec.class_builder("Taco").add_modifiers(Modifier.ABSTRACT).add_modifiers(Modifier.FINAL)
+        with self.assertRaises(ValueError):
+            builder.build()
+
+    def test_one_shot_build(self):
+        """Test a builder cannot be reused after a one-shot build."""
+        builder = TypeSpec.class_builder("Taco").add_modifiers(Modifier.PUBLIC)
+        taco = builder.build(one_shot=True)
+        self.assertIn("public class Taco", str(taco))
+        with self.assertRaises(ValueError):
+            builder.add_modifiers(Modifier.FINAL)
+        with self.assertRaises(ValueError):
+            builder.build()
+
+    def test_reusable_build(self):
+        """Test building without consuming the builder."""
+        builder = TypeSpec.class_builder("Taco")
+        first = builder.build()
+        second = builder.add_field(FieldSpec.builder("int", "size").build()).build()
+        self.assertNotIn("size", str(first))
+        self.assertIn("int size;", str(second))
+
+    def test_get_imports(self):
+        """Test imports are collected per package and cached."""
+        type_spec = (
+            TypeSpec.class_builder("Taco")
+            .add_field(FieldSpec.builder(ClassName.get("java.util", "List"), "fillings").build())
+            .add_field(FieldSpec.builder(ClassName.get("com.example", "Shell"), "shell").build())
+            .add_field(FieldSpec.builder(ClassName.get("java.lang", "String"), "name").build())
+            .build()
+        )
+
+        imports = type_spec._get_imports("com.example")
+        self.assertEqual(imports, {"java.util": {"List"}})
+        self.assertIs(type_spec._get_imports("com.example"), imports)
+        self.assertEqual(type_spec._get_imports("com.other"), {"java.util": {"List"}, "com.example": {"Shell"}})
+
+        # The cache is shared by every JavaFile built from this type, so it cannot be changed
+        with self.assertRaises(TypeError):
+            imports["java.util"] = frozenset({"Bogus"})
+        with self.assertRaises(AttributeError):
+            imports["java.util"].add("Bogus")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,7 +16,39 @@ limitations under the License.
 
 import unittest
 
-from pyjavapoet.util import is_ascii_upper
+from pyjavapoet.type_name import ClassName
+from pyjavapoet.util import (
+    JAVA_KEYWORDS,
+    character_literal,
+    deep_copy,
+    is_ascii_upper,
+    is_valid_java_identifier,
+    string_literal,
+)
+
+LONG_STRING = "a" * 1000
+
+# (input, expected) pairs shared by the literal escaping tests
+CHARACTER_LITERAL_CASES = (
+    ('"', "'\"'"),
+    ("\n", "'\\n'"),
+    ("\t", "'\\t'"),
+    ("\0", "'\\u0000'"),
+    ("\x7f", "'\\u007f'"),
+    ("\u2603", "'\u2603'"),
+    ("\U0001f4a9", "'\U0001f4a9'"),
+)
+STRING_LITERAL_CASES = (
+    ("", '""'),
+    ("abc", '"abc"'),
+    (LONG_STRING, f'"{LONG_STRING}"'),
+    ("it's", '"it\'s"'),
+    ('say "hi"', '"say \\"hi\\""'),
+    ("\b\t\n\f\r\\", '"\\b\\t\\n\\f\\r\\\\"'),
+    ("\x01\x85", '"\\u0001\\u0085"'),
+    ("\u2603 \u65e5\u672c", '"\u2603 \u65e5\u672c"'),
+    ("\u2603\n", '"\u2603\\n"'),
+)
 
 
 class UtilTest(unittest.TestCase):
@@ -30,6 +62,60 @@ class UtilTest(unittest.TestCase):
         self.assertFalse(is_ascii_upper(""))
         self.assertFalse(is_ascii_upper(" "))
 
+    def test_deep_copy(self):
+        """Test deep_copy copies containers and specs but shares atomic values."""
+        class_name = ClassName.get("com.example", "Taco")
+        original = {"names": ["a", "b"], "type": class_name, "flag": True}
+
+        copied = deep_copy(original)
+        self.assertEqual(original, copied)
+        self.assertIsNot(original, copied)
+        self.assertIsNot(original["names"], copied["names"])
+        self.assertIsNot(class_name, copied["type"])
+        self.assertIs(original["names"][0], copied["names"][0])
+
+    def test_is_valid_java_identifier(self):
+        """Test every Java keyword is rejected as an identifier."""
+        self.assertTrue(is_valid_java_identifier("taco"))
+        self.assertTrue(is_valid_java_identifier("Class"))
+        self.assertFalse(is_valid_java_identifier("1taco"))
+        for keyword in JAVA_KEYWORDS:
+            with self.subTest(keyword=keyword):
+                self.assertFalse(is_valid_java_identifier(keyword))
+
+    def test_character_literal_printable_ascii(self):
+        """Test printable ASCII is quoted as is, apart from the quote and backslash."""
+        for code_point in range(32, 127):
+            c = chr(code_point)
+            expected = {"'": "'\\''", "\\": "'\\\\'"}.get(c, f"'{c}'")
+            with self.subTest(c=c):
+                self.assertEqual(character_literal(c), expected)
+
+    def test_character_literal(self):
+        """Test character literals escape like Java source."""
+        for c, expected in CHARACTER_LITERAL_CASES:
+            with self.subTest(c=c):
+                self.assertEqual(character_literal(c), expected)
+
+        with self.assertRaises(ValueError):
+            character_literal("ab")
+
+    def test_string_literal(self):
+        """Test string literals escape like Java source."""
+        for s, expected in STRING_LITERAL_CASES:
+            with self.subTest(s=s[:20]):
+                self.assertEqual(string_literal(s), expected)
+
+    def test_literal_consistency(self):
+        """Test character and string literals escape alike except for the quote characters."""
+        characters = [chr(code_point) for code_point in range(256)] + ["\u2603", "\U0001f4a9"]
+        differences = {
+            (c, character_literal(c)[1:-1], string_literal(c)[1:-1])
+            for c in characters
+            if character_literal(c)[1:-1] != string_literal(c)[1:-1]
+        }
+        self.assertEqual(differences, {("'", "\\'", "'"), ('"', '"', '\\"')})
+
 
 if __name__ == "__main__":
     unittest.main()